@@ -1,164 +1,127 @@
-import pandas as pd
-import numpy as np
 import streamlit as st
-import folium
-import inflection
-from streamlit_folium import folium_static
-from folium.plugins import MarkerCluster
-from PIL import Image
-
-st.set_page_config(page_title="Página Principal",  page_icon='📊', layout="wide")
-
-# ==============================================================================
-# 1. Configurações Iniciais e Dicionários
-# ==============================================================================
 
+from fome_zero.analytics import Dataset
+from fome_zero.cubes import SelectionTotals
+from fome_zero.export import EXPORT_FORMATS, export_bytes
+from fome_zero.layout import performance_expander, sidebar_header
+from fome_zero.maps import MAP_POINT_LIMIT, map_html
+from fome_zero.prerender import prerendered_map
+from fome_zero.timing import start_page
 
-COLORS = {
-    "3F7E00": "darkgreen",
-    "5BA829": "green",
-    "9ACD32": "lightgreen",
-    "CDD614": "orange",
-    "FFBA00": "red",
-    "CBCBC8": "darkred",
-    "FF7800": "darkred",
-}
-
-def country_name(country_id):
-    COUNTRIES = {
-        1: 'India', 14: 'Australia', 30: 'Brazil', 37: 'Canada', 94: 'Indonesia',
-        148: 'New Zealand', 162: 'Philippines', 166: 'Qatar', 184: 'Singapore',
-        189: 'South Africa', 191: 'Sri Lanka', 208: 'Turkey',
-        214: 'United Arab Emirates', 215: 'United Kingdom', 216: 'United States'
-    }
-    return COUNTRIES.get(country_id, "Unknown")
-
-def color_name(color_code):
-    return COLORS.get(color_code, "gray")
+st.set_page_config(page_title="Página Principal",  page_icon='📊', layout="wide")
+start_page('principal')
 
 # ==============================================================================
-# 2. Processamento de Dados (Ajustado para 6.929 registros)
+# 1. Processamento de Dados
 # ==============================================================================
 
-def clean_code(df):
-    df_processing = df.copy()
+def get_selection_totals(countries_selected):
+    """Totais da seleção, guardados na sessão e atualizados só com os países que mudaram."""
+    df_cube = Dataset.current().country_cube
+    totals = st.session_state.get('selection_totals')
+    if totals is None or totals.cube is not df_cube:  # primeira execução ou dados novos
+        totals = st.session_state['selection_totals'] = SelectionTotals(df_cube)
+    return totals.update(countries_selected).stats()
+
+def get_metrics(totals):
+    unique_restaurants = totals['Restaurant ID']
+    unique_countries = totals['Country Name']
+    unique_cities = totals['City']
+    total_votes = totals['Votes']
+    # Culinárias distintas vêm da união dos conjuntos de cada país (ver fome_zero/cubes.py)
+    unique_cuisine_types = totals['Cuisines']
     
-    # 1. Criação da coluna de Países
-    df_processing['Country Name'] = df_processing['Country Code'].apply(country_name)
-    
-    # 2. Tratamento de Coordenadas (Divisão por 10^10 conforme solicitado)
-    # Convertemos para string para garantir que o replace funcione em qualquer formato
-    df_processing['Latitude'] = df_processing['Latitude'].astype(str).str.replace('.', '', regex=False).astype(float) / 10**10
-    df_processing['Longitude'] = df_processing['Longitude'].astype(str).str.replace('.', '', regex=False).astype(float) / 10**10
-
-    # 3. Limpeza de Strings (Remoção de espaços)
-    for col in df_processing.select_dtypes(include=['object']).columns:
-        df_processing[col] = df_processing[col].astype(str).str.strip()
+    return unique_restaurants, unique_countries, unique_cities, total_votes, unique_cuisine_types
 
-    # 4. REMOÇÃO DE DUPLICADAS PELO ID (Essencial para chegar aos 6.929)
-    df_processing = df_processing.drop_duplicates(subset='Restaurant ID', keep='first')
+# Arquivos de download compartilhados entre sessões; só são gerados quando alguém clica em baixar
+EXPORT_CACHE_ENTRIES = 16
 
-    # 5. Conversão de tipos
-    binary_columns = ['Has Table booking', 'Has Online delivery', 'Is delivering now', 'Switch to order menu']
-    for col in binary_columns:
-        if col in df_processing.columns:
-            df_processing[col] = df_processing[col].astype(bool)
+@st.cache_data(max_entries=EXPORT_CACHE_ENTRIES, show_spinner=False)
+def export_data(countries, fmt, version, _ds):
+    """Arquivo de download para uma seleção (tupla ordenada de países) no formato `fmt`.
 
-    df_processing['Price range'] = df_processing['Price range'].astype('category')
-
-    # Resetar o index
-    df_final = df_processing.reset_index(drop=True)
-    
-    return df_final
-
-def get_metrics(df_filtered):
-    unique_restaurants = df_filtered['Restaurant ID'].nunique()
-    unique_countries = df_filtered['Country Name'].nunique()
-    unique_cities = df_filtered['City'].nunique()
-    total_votes = df_filtered['Votes'].sum()
-    # Tratamento para culinárias (evitando erros com valores vazios)
-    unique_cuisine_types = df_filtered['Cuisines'].astype(str).str.split(', ').explode().nunique()
-    
-    return unique_restaurants, unique_countries, unique_cities, total_votes, unique_cuisine_types
+    `version` (= `_ds.version`) faz parte da chave do cache, como em `render_map_html`.
+    """
+    # Arquivo exportado leva todas as colunas (endereços inclusos), lidas só aqui
+    df_export = _ds.full_df
+    return export_bytes(df_export[df_export['Country Name'].isin(countries)], fmt)
 
 # ==============================================================================
-# 3. Função do Mapa Interativo
+# 2. Função do Mapa Interativo
 # ==============================================================================
 
-def create_map(df_map):
-    # Localização média para centralizar o mapa
-    if not df_map.empty:
-        m = folium.Map(location=[df_map['Latitude'].median(), df_map['Longitude'].median()], zoom_start=2)
-    else:
-        m = folium.Map(location=[0, 0], zoom_start=2)
-
-    marker_cluster = MarkerCluster().add_to(m)
-
-    for _, row in df_map.iterrows():
-        icon_color = color_name(row['Rating color'])
-        
-        popup_content = f"""
-            <div style="width: 200px">
-                <b>{row['Restaurant Name']}</b><br>
-                <i>{row['Cuisines']}</i><br><br>
-                <b>Nota:</b> {row['Aggregate rating']} / 5.0<br>
-                <b>Preço para dois:</b> {row['Average Cost for two']} ({row['Currency']})
-            </div>
-        """
-        
-        folium.Marker(
-            location=[row['Latitude'], row['Longitude']],
-            popup=folium.Popup(popup_content, max_width=300),
-            icon=folium.Icon(color=icon_color, icon='utensils', prefix='fa')
-        ).add_to(marker_cluster)
-    
-    return m
+# HTML do mapa compartilhado entre sessões; limite evita guardar todas as combinações de países
+MAP_CACHE_ENTRIES = 32
+
+@st.cache_data(max_entries=MAP_CACHE_ENTRIES, show_spinner=False)
+def render_map_html(countries, show_grid, version, _ds):
+    """Gera o HTML do mapa para uma seleção (tupla ordenada de países) a partir de `_ds`.
+
+    `version` (= `_ds.version`) faz parte da chave do cache (ao trocar o CSV o mapa é refeito)
+    e escolhe o mapa pré-renderizado; chave e dados vêm do mesmo `Dataset`.
+    """
+    # Mapa pré-renderizado em lote para esta seleção, se houver (ver fome_zero/prerender.py)
+    html = prerendered_map(countries, show_grid, version)
+    if html is not None:
+        return html
+    return map_html(_ds.subset(countries), countries, show_grid)
 
 # ==============================================================================
-# 4. Execução do Dashboard
+# 3. Execução do Dashboard
 # ==============================================================================
 
 # Carregamento do arquivo
 try:
-    # Ajuste o caminho conforme necessário
-    df_raw = pd.read_csv('data_set/zomato.csv') 
-    df = clean_code(df_raw)
+    # Leitura e limpeza compartilhadas entre páginas e sessões (ver fome_zero/registry.py)
+    df_cube = Dataset.current().country_cube
 except Exception as e:
     st.error(f"Erro ao carregar os dados. Verifique se o arquivo 'zomato.csv' está na pasta correta. Erro: {e}")
     st.stop()
 
 # --- BARRA LATERAL (SIDEBAR) ---
-col1, col2 = st.sidebar.columns([1, 4])
-try:
-    col1.image(Image.open('logo1.png'), width=100)
-except:
-    col1.warning("!")
-col2.markdown("### Fome Zero")
+sidebar_header()
 st.sidebar.markdown("---")
 st.sidebar.markdown("### Filtros")
 
 # Filtro de Países
-paises_lista = sorted(df['Country Name'].unique().tolist())
+paises_lista = sorted(df_cube['Country Name'].tolist())
 countries_selected = st.sidebar.multiselect(
     'Escolha os países para visualizar os restaurantes:',
     options=paises_lista,
     default=paises_lista # Começa com todos selecionados
 )
 
-# Filtro aplicado
-df_filtered = df[df['Country Name'].isin(countries_selected)]
+# Exibição do mapa: o controle é desenhado aqui pelo fragmento `map_section`
+map_controls = st.sidebar.container()
+
+# Filtro aplicado: soma das métricas pré-calculadas dos países, sem filtrar as linhas
+totals = get_selection_totals(countries_selected)
 
 # Download dos dados tratados (Exatamente os 6.929 ou filtrados)
-st.sidebar.markdown("---")
-csv = df_filtered.to_csv(index=False).encode('utf-8')
-st.sidebar.download_button("📥 Download CSV", data=csv, file_name='dados_tratados.csv', mime='text/csv')
+@st.fragment
+def download_section(countries_selected):
+    """Formato + botão de download: trocar o formato reexecuta só este bloco."""
+    st.sidebar.markdown("---")
+    export_format = st.sidebar.selectbox('Formato do download:', options=list(EXPORT_FORMATS))
+    extension, mime = EXPORT_FORMATS[export_format]
+    ds = Dataset.current()
+    export_key = (tuple(sorted(countries_selected)), export_format, ds.version)
+    st.sidebar.download_button(
+        f"📥 Download {export_format}",
+        data=lambda: export_data(*export_key, ds),  # gerado sob demanda, no clique
+        file_name=f'dados_tratados.{extension}',
+        mime=mime,
+        on_click='ignore',
+    )
+
+download_section(countries_selected)
 
 # --- CONTEÚDO PRINCIPAL ---
 st.title("📍 Fome Zero!")
 st.subheader("O melhor lugar para encontrar seu novo restaurante favorito!")
 
 # Métricas formatadas
-res, countries, cities, votes, cuisines = get_metrics(df_filtered)
+res, countries, cities, votes, cuisines = get_metrics(totals)
 m1, m2, m3, m4, m5 = st.columns(5)
 
 m1.metric("Restaurantes", f"{res:,}".replace(',', '.'))
@@ -169,8 +132,24 @@ m5.metric("Culinárias", cuisines)
 
 # MAPA
 st.markdown("---")
-st.subheader(f"Mapa de Restaurantes ({len(df_filtered)} exibidos)")
+st.subheader(f"Mapa de Restaurantes ({totals['Restaurant ID']} exibidos)")
+
+@st.fragment
+def map_section(countries_selected, n_restaurants, map_controls):
+    """Modo de exibição + mapa: trocar o modo reexecuta só este bloco."""
+    map_mode = map_controls.radio(
+        'Exibição do mapa:',
+        options=['Automática', 'Restaurantes', 'Agrupada por região'],
+        help=f'No modo automático, seleções com mais de {MAP_POINT_LIMIT:,} restaurantes são agrupadas em regiões.'.replace(',', '.')
+    )
+
+    show_grid = map_mode == 'Agrupada por região' or (map_mode == 'Automática' and n_restaurants > MAP_POINT_LIMIT)
+
+    with st.container():
+        ds = Dataset.current()
+        mapa_html = render_map_html(tuple(sorted(countries_selected)), show_grid, ds.version, ds)
+        st.iframe(mapa_html, width=1200, height=610)
+
+map_section(countries_selected, totals['Restaurant ID'], map_controls)
 
-with st.container():
-    mapa_interativo = create_map(df_filtered)
-    folium_static(mapa_interativo, width=1200, height=600)
\ No newline at end of file
+performance_expander()
@@ -0,0 +1 @@
+# Na raiz do repositório para que `pytest` encontre o pacote fome_zero sem instalação
@@ -0,0 +1,5 @@
+"""Código compartilhado entre as páginas do dashboard Fome Zero.
+
+Sem imports aqui: importe direto dos módulos (`fome_zero.analytics`, `fome_zero.data`...),
+para que `python -m fome_zero.<módulo>` não carregue o pacote inteiro antes do módulo.
+"""
@@ -0,0 +1,360 @@
+"""Cálculos de cada página como funções puras sobre um `Dataset`, sem Streamlit.
+
+As páginas só desenham o que estas funções devolvem; o mesmo código serve ao benchmark,
+a relatórios em lote e a execuções fora do navegador:
+
+    ds = Dataset.current()                       # versão publicada, compartilhada entre sessões
+    ds = Dataset(clean_code(read_csv(caminho)))   # qualquer DataFrame limpo
+    country_stats(ds, ['Brazil', 'Qatar'])
+"""
+from functools import cached_property, lru_cache
+
+import pandas as pd
+
+from fome_zero import cubes, restaurants
+from fome_zero.cuisines import build_cuisine_index, explode_cuisines, has_any_cuisine
+from fome_zero.data import DATA_PATH, read_full, read_version
+from fome_zero.geo import build_grid_cube, grid_cells
+from fome_zero.shards import read_shards
+from fome_zero.timing import timed
+
+# ==============================================================================
+# Dataset
+# ==============================================================================
+
+# Seleções de países com `Dataset` próprio em cache (ver `Dataset.subset`)
+SUBSET_CACHE_ENTRIES = 16
+
+class Dataset:
+    """DataFrame limpo + estruturas derivadas (índice de culinárias, cubos, rankings), criadas sob demanda.
+
+    As estruturas são construídas a partir de `df` e guardadas no próprio objeto. O objeto
+    de `Dataset.current()` é o publicado pelo registro e compartilhado entre sessões: cada
+    estrutura é construída uma vez por versão, e a versão é a dos arquivos que geraram `df`.
+
+    Com partições por país (`shards`, ver fome_zero/shards.py), `df` só é lido quando
+    alguém precisa de todos os países; `subset` monta um `Dataset` com as linhas dos
+    países selecionados, lidas só das partições deles.
+    """
+
+    def __init__(self, df=None, path=None, version=None, shards=None):
+        if df is not None:
+            self.df = df
+        self.path = path
+        self.version = version
+        self.shards = shards
+        self._subsets = lru_cache(maxsize=SUBSET_CACHE_ENTRIES)(self._subset)
+
+    @classmethod
+    def read(cls, path=DATA_PATH):
+        """Lê os dados de `path` (as partições, quando atualizadas), guardando a versão do conteúdo lido."""
+        version, shards = read_version(path, read_shards)
+        if shards is not None:
+            return cls(path=str(path), version=version, shards=shards)
+        version, df = read_version(path)
+        return cls(df, str(path), version)
+
+    @classmethod
+    def current(cls, path=DATA_PATH):
+        """Versão publicada dos dados em `path` (ver fome_zero/registry.py)."""
+        from fome_zero.registry import published_dataset
+
+        return published_dataset(path)
+
+    @cached_property
+    def df(self):
+        # só existe sem `df` no construtor: todas as partições da geração lida
+        return self.shards.frame()
+
+    def subset(self, countries):
+        """`Dataset` (mesma versão) com as linhas dos países `countries`, lidas das partições deles.
+
+        As funções deste módulo dão o mesmo resultado para esses países com o objeto
+        devolvido e com o original. Sem partições, ou com `df` já lido, devolve o próprio
+        objeto: as funções já filtram os países.
+        """
+        if self.shards is None or 'df' in self.__dict__:
+            return self
+        return self._subsets(frozenset(countries))
+
+    def _subset(self, countries):
+        return Dataset(path=self.path, version=self.version, shards=self.shards.restrict(countries))
+
+    @cached_property
+    def cuisine_index(self):
+        return build_cuisine_index(self.df, None if self.shards is None else self.shards.cuisines)
+
+    @cached_property
+    def country_cube(self):
+        return cubes.build_country_cube(self.df, self.cuisine_index)
+
+    @cached_property
+    def city_cube(self):
+        return cubes.build_city_cube(self.df, self.cuisine_index)
+
+    @cached_property
+    def restaurant_tables(self):
+        return restaurants.build_restaurant_tables(self.df, self.cuisine_index)
+
+    @cached_property
+    def grid_cube(self):
+        return build_grid_cube(self.df)
+
+    def warm(self):
+        """Constrói todas as estruturas derivadas de uma vez (antes de publicar uma versão nova).
+
+        Com partições não há o que adiantar: as estruturas vêm dos arquivos da geração
+        lida, que não mudam, e são montadas quando alguma página precisa delas.
+        """
+        if self.shards is not None:
+            return self
+        for name in ('cuisine_index', 'country_cube', 'city_cube', 'restaurant_tables', 'grid_cube'):
+            getattr(self, name)
+        return self
+
+    @cached_property
+    def full_df(self):
+        """Todas as colunas do CSV (endereços etc.), lidas só quando alguém baixa os dados.
+
+        Se o arquivo já foi trocado por outro, devolve `df`: o download continua
+        coerente com o que as páginas mostram até a versão nova ser publicada.
+        """
+        if self.path is None:
+            return self.df
+        version, df_full = read_version(self.path, read_full)
+        return df_full if version == self.version else self.df
+
+    def countries(self):
+        """Nomes dos países presentes nos dados, em ordem alfabética."""
+        if self.shards is not None:
+            return sorted(self.shards.countries)
+        return sorted(map(str, self.df['Country Name'].unique()))
+
+    def select(self, countries, cuisines=()):
+        """Linhas dos países (e, se houver, das culinárias) selecionados, com o índice de `df`."""
+        df = self.df[self.df['Country Name'].isin(countries)]
+        if len(cuisines):
+            df = df[has_any_cuisine(df, self.cuisine_index, cuisines)]
+        return df
+
+# Filtros iniciais das páginas Países, Cidades, Restaurantes e Culinária (a principal começa com todos)
+DEFAULT_COUNTRIES = ['Brazil', 'Canada', 'Australia', 'Qatar']
+
+# ==============================================================================
+# Países
+# ==============================================================================
+
+def country_stats(ds, countries):
+    """Uma linha por país selecionado com todas as métricas da página Países."""
+    return cubes.country_stats(ds.country_cube, countries)
+
+def rank_countries(df_stats, col, ascending=False, drop_zero=False):
+    """Ordena os países pela métrica `col` (opcionalmente sem os que zeram a métrica)."""
+    df_aux = df_stats[['Country Name', col]]
+    if drop_zero:
+        df_aux = df_aux[df_aux[col] > 0]
+    return df_aux.sort_values(col, ascending=ascending).reset_index(drop=True)
+
+# ==============================================================================
+# Cidades
+# ==============================================================================
+
+# Rankings da página Cidades: nome -> (métrica, k, descartar cidades zeradas)
+CITY_RANKINGS = {
+    'restaurantes': ('Restaurant ID', 10, False),
+    'notas_altas': ('Rating above 4', 10, True),
+    'notas_baixas': ('Rating below 2.5', 10, True),
+    'preco': ('Average Cost for two', 10, False),
+    'diversidade': ('Cuisines', 10, False),
+    'entregando': ('Is delivering now', 7, True),
+    'online': ('Has Online delivery', 7, True),
+    'reserva': ('Has Table booking', 7, True),
+}
+
+def city_stats(ds, countries):
+    """Uma linha por cidade dos países selecionados com todas as métricas da página Cidades."""
+    return cubes.city_stats(ds.city_cube, countries)
+
+def city_ranking(ds, countries, name):
+    """Um dos rankings de `CITY_RANKINGS` para a seleção."""
+    col, k, drop_zero = CITY_RANKINGS[name]
+    return cubes.top_k(city_stats(ds, countries), col, k, drop_zero=drop_zero)
+
+def city_rankings(ds, countries):
+    """Todos os rankings da página Cidades, por nome."""
+    df_cities = city_stats(ds, countries)
+    return {name: cubes.top_k(df_cities, col, k, drop_zero=drop_zero)
+            for name, (col, k, drop_zero) in CITY_RANKINGS.items()}
+
+# ==============================================================================
+# Restaurantes
+# ==============================================================================
+
+# Ranking -> (função de fome_zero/restaurants.py, tamanho exibido na página)
+RESTAURANT_RANKINGS = {
+    'voted': (restaurants.top_voted, 10),
+    'rated': (restaurants.top_rated, 20),
+    'costly': (restaurants.top_cost, 10),
+    'brazilian_best': (restaurants.best_brazilian, 10),
+    'brazilian_worst': (restaurants.worst_brazilian, 10),
+}
+
+def restaurant_ranking(ds, countries, name):
+    """Um dos rankings de `RESTAURANT_RANKINGS` para a seleção."""
+    ranking, k = RESTAURANT_RANKINGS[name]
+    return ranking(ds.restaurant_tables, countries, k)
+
+def restaurant_rankings(ds, countries):
+    """Todos os rankings da página Restaurantes, por nome."""
+    return {name: restaurant_ranking(ds, countries, name) for name in RESTAURANT_RANKINGS}
+
+def delivery_engagement(ds, countries):
+    """Soma de votos com e sem pedido online (colunas `Has Online delivery`, `Votes`)."""
+    return ds.select(countries).groupby('Has Online delivery')['Votes'].sum().reset_index()
+
+def booking_cost(ds, countries):
+    """Custo médio para dois com e sem reserva (colunas `Has Table booking`, `Average Cost for two`)."""
+    return ds.select(countries).groupby('Has Table booking')['Average Cost for two'].mean().reset_index()
+
+def usa_cuisine_costs(ds, countries):
+    """Custo médio para dois da culinária japonesa e de BBQ nos EUA (NaN sem restaurantes)."""
+    df_usa = ds.select([country for country in countries if country == 'United States'])
+    jp_avg = df_usa[df_usa['Cuisines'].str.contains('Japanese', case=False, na=False)]['Average Cost for two'].mean()
+    bbq_avg = df_usa[df_usa['Cuisines'].str.contains('BBQ', case=False, na=False)]['Average Cost for two'].mean()
+    return jp_avg, bbq_avg
+
+# ==============================================================================
+# Culinárias
+# ==============================================================================
+
+# Culinárias com melhor/pior restaurante em destaque na página, com o emoji do título
+HIGHLIGHT_CUISINES = {
+    "Italian": "🍝", "American": "🍔", "Arabian": "🥙",
+    "Japanese": "🍣", "Home-made": "🏠"
+}
+
+# Filtro inicial de culinárias da página
+DEFAULT_CUISINES = ['Italian', 'American', 'Arabian', 'Japanese', 'Home-made', 'BBQ', 'Brazilian']
+
+# Só culinárias com mais restaurantes que isto entram nos rankings de notas
+MIN_CUISINE_RESTAURANTS = 5
+
+def cuisine_names(ds):
+    """Culinárias distintas, em ordem alfabética."""
+    if ds.shards is not None:
+        return list(ds.shards.cuisines)
+    return ds.cuisine_index.names.tolist()
+
+@timed('explode_cuisines')
+def cuisine_rows(ds, df):
+    """Uma linha por culinária de cada restaurante de `df` (linhas de `ds.select`)."""
+    return explode_cuisines(df, ds.cuisine_index)
+
+def rank_cuisines(values, ascending, k):
+    """As `k` primeiras culinárias de uma média por culinária; empates ficam em ordem alfabética.
+
+    Mesmo desempate do `idxmax`/`idxmin` dos insights: a primeira linha é a culinária que eles escolhiam.
+    """
+    return (values.reset_index()
+                  .sort_values([values.name, 'Cuisines'], ascending=[ascending, True], kind='stable')
+                  .reset_index(drop=True)
+                  .head(k))
+
+def cuisine_extremes(ds, countries, cuisines, cuisine_name):
+    """Melhor restaurante e pior restaurante com votos da culinária (por trecho do nome); None se não houver."""
+    df = ds.select(countries, cuisines)
+    df_c = df[has_any_cuisine(df, ds.cuisine_index, cuisine_name, partial=True)]
+    if df_c.empty:
+        return None, None
+    best = df_c.sort_values(by='Aggregate rating', ascending=False).iloc[0]
+    df_low = df_c[df_c['Votes'] > 0]
+    worst = df_low.sort_values(by='Aggregate rating', ascending=True).iloc[0] if not df_low.empty else None
+    return best, worst
+
+def expensive_cuisines(ds, countries, cuisines, k=10):
+    """As `k` culinárias com maior custo médio para dois (colunas `Cuisines`, `Average Cost for two`)."""
+    df_cuisines = cuisine_rows(ds, ds.select(countries, cuisines))
+    return rank_cuisines(df_cuisines.groupby('Cuisines', observed=True)['Average Cost for two'].mean(),
+                         ascending=False, k=k)
+
+def cuisine_ratings(ds, countries, cuisines, top=True, k=10, min_restaurants=MIN_CUISINE_RESTAURANTS):
+    """As `k` culinárias com maior (`top`) ou menor nota média (colunas `Cuisines`, `Aggregate rating`).
+
+    Só entram culinárias com mais de `min_restaurants` restaurantes; as menores notas
+    consideram apenas restaurantes com votos.
+    """
+    df_cuisines = cuisine_rows(ds, ds.select(countries, cuisines))
+    if min_restaurants:
+        counts = df_cuisines['Cuisines'].value_counts()
+        df_cuisines = df_cuisines[df_cuisines['Cuisines'].isin(counts[counts > min_restaurants].index)]
+    if not top:
+        df_cuisines = df_cuisines[df_cuisines['Votes'] > 0]
+    return rank_cuisines(df_cuisines.groupby('Cuisines', observed=True)['Aggregate rating'].mean(),
+                         ascending=not top, k=k)
+
+def delivery_cuisines(ds, countries, cuisines, k=10):
+    """As `k` culinárias com mais restaurantes entregando online agora (colunas `Cuisines`, `Quantidade`)."""
+    df = ds.select(countries, cuisines)
+    df_delivery = df[df['Has Online delivery'] & df['Is delivering now']]
+    if df_delivery.empty:
+        return pd.DataFrame({'Cuisines': [], 'Quantidade': []})
+    counts = cuisine_rows(ds, df_delivery)['Cuisines'].value_counts()
+    # a coluna é categórica: `value_counts` lista também as culinárias sem nenhuma entrega (contagem 0)
+    return (counts[counts > 0].reset_index()
+                              .rename(columns={'count': 'Quantidade'})
+                              .head(k))
+
+def cuisine_stats(ds, countries, cuisines=()):
+    """Todos os números da página Culinária para a seleção, por nome."""
+    return {
+        'extremes': {name: cuisine_extremes(ds, countries, cuisines, name) for name in HIGHLIGHT_CUISINES},
+        'expensive': expensive_cuisines(ds, countries, cuisines),
+        'best_rated': cuisine_ratings(ds, countries, cuisines, top=True),
+        'worst_rated': cuisine_ratings(ds, countries, cuisines, top=False),
+        'worst_voted': cuisine_ratings(ds, countries, cuisines, top=False, k=1, min_restaurants=0),
+        'delivery': delivery_cuisines(ds, countries, cuisines),
+    }
+
+# ==============================================================================
+# Mapa
+# ==============================================================================
+
+# Cor do marcador (Folium) para cada `Rating color` do dataset
+RATING_COLORS = {
+    "3F7E00": "darkgreen",
+    "5BA829": "green",
+    "9ACD32": "lightgreen",
+    "CDD614": "orange",
+    "FFBA00": "red",
+    "CBCBC8": "darkred",
+    "FF7800": "darkred",
+}
+
+# Colunas enviadas ao navegador, na ordem em que o callback JavaScript do mapa as lê
+MAP_COLUMNS = ['Latitude', 'Longitude', 'Restaurant Name', 'Cuisines',
+               'Aggregate rating', 'Average Cost for two', 'Currency', 'Icon color']
+
+def color_name(color_code):
+    return RATING_COLORS.get(color_code, "gray")
+
+def map_points(ds, countries):
+    """Restaurantes com coordenadas válidas dos países selecionados, nas colunas `MAP_COLUMNS`."""
+    df_map = ds.select(countries)
+    df_map = df_map[df_map['Valid coordinates']]
+    df_points = df_map.assign(**{'Icon color': df_map['Rating color'].map(color_name)})
+    return df_points[MAP_COLUMNS]
+
+def map_center(ds, countries):
+    """Mediana das coordenadas válidas da seleção (centro do mapa); [0, 0] sem restaurantes.
+
+    Lê só as colunas de coordenadas: no modo agrupado, o mapa não precisa de `map_points`.
+    """
+    selected = ds.df['Country Name'].isin(countries) & ds.df['Valid coordinates']
+    coords = ds.df.loc[selected, ['Latitude', 'Longitude']]
+    if coords.empty:
+        return [0, 0]
+    return [coords['Latitude'].median(), coords['Longitude'].median()]
+
+def map_cells(ds, countries):
+    """Células da grade por nível de zoom para o mapa agregado (ver fome_zero/geo.py)."""
+    return grid_cells(ds.grid_cube, list(countries))
@@ -0,0 +1,157 @@
+"""Benchmark das funções de cálculo das páginas, sem servidor Streamlit.
+
+Roda cada etapa (leitura, limpeza, índices, cubos, as consultas por seleção de fome_zero/analytics.py
+e os gráficos e o mapa de cada página, de fome_zero/figures.py e fome_zero/maps.py) sobre o `zomato.csv` e sobre cópias sintéticas dele multiplicadas por cada escala,
+medindo tempo (melhor de `--repeat` execuções) e pico de memória (tracemalloc):
+
+    python -m fome_zero.bench                      # escalas 1, 10 e 100
+    python -m fome_zero.bench --scales 1 1000      # 1000x usa alguns GB de memória
+    python -m fome_zero.bench --output bench.csv   # guarda a tabela para comparar depois
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from fome_zero.analytics import (DEFAULT_COUNTRIES, Dataset, booking_cost, city_rankings, country_stats,
+                                 cuisine_stats, delivery_engagement, map_cells, map_points, restaurant_rankings,
+                                 usa_cuisine_costs)
+from fome_zero.cubes import SelectionTotals, build_city_cube, build_country_cube
+from fome_zero.cuisines import build_cuisine_index
+from fome_zero.data import DATA_PATH, clean_code, read_csv
+from fome_zero.export import export_bytes
+from fome_zero.figures import page_charts
+from fome_zero.geo import build_grid_cube
+from fome_zero.maps import map_html
+from fome_zero.restaurants import build_restaurant_tables
+
+# ==============================================================================
+# Configurações
+# ==============================================================================
+
+DEFAULT_SCALES = (1, 10, 100)
+DEFAULT_REPEAT = 3
+
+# Páginas com gráficos Plotly (ver `page_charts`)
+CHART_PAGES = ('paises', 'cidades', 'restaurantes', 'culinaria')
+
+# ==============================================================================
+# Dados sintéticos
+# ==============================================================================
+
+def scale_raw(df_raw, scale):
+    """`scale` cópias das linhas lidas do CSV, com `Restaurant ID` distintos em cada cópia.
+
+    Os IDs precisam mudar para que a deduplicação de `clean_code` não desfaça a ampliação.
+    """
+    if scale == 1:
+        return df_raw
+    offset = int(df_raw['Restaurant ID'].max()) + 1
+    df_scaled = pd.concat([df_raw] * scale, ignore_index=True)
+    copy = np.repeat(np.arange(scale, dtype=np.int64), len(df_raw))
+    df_scaled['Restaurant ID'] = df_scaled['Restaurant ID'].to_numpy() + copy * offset
+    return df_scaled
+
+# ==============================================================================
+# Medição
+# ==============================================================================
+
+def measure(func, repeat=DEFAULT_REPEAT):
+    """Melhor tempo (s) entre `repeat` execuções e pico de memória (bytes) de uma execução extra."""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    # tracemalloc deixa a execução mais lenta, por isso a memória é medida à parte
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(timings), peak
+
+def build_all(charts):
+    """Calcula e desenha todos os gráficos de uma página, como num rerun sem nada em cache."""
+    return [build() for build in charts.values()]
+
+def benchmarks(df_raw, selection=DEFAULT_COUNTRIES):
+    """Etapas medidas, em ordem: (nome, função sem argumentos).
+
+    Cada etapa recebe prontos os resultados das anteriores, como acontece nas páginas
+    depois que os caches por processo estão carregados.
+    """
+    df = clean_code(df_raw)
+    ds = Dataset(df)
+    index, country_cube = ds.cuisine_index, ds.country_cube
+    ds.city_cube, ds.restaurant_tables, ds.grid_cube  # constrói antes das consultas por seleção
+    cuisines = ['Italian', 'Japanese']
+
+    return [
+        # carga dos dados e estruturas derivadas (uma vez por versão dos dados)
+        ('clean_code', lambda: clean_code(df_raw)),
+        ('build_cuisine_index', lambda: build_cuisine_index(df)),
+        ('build_country_cube', lambda: build_country_cube(df, index)),
+        ('build_city_cube', lambda: build_city_cube(df, index)),
+        ('build_restaurant_tables', lambda: build_restaurant_tables(df, index)),
+        ('build_grid_cube', lambda: build_grid_cube(df)),
+        # consultas por seleção (a cada rerun com filtros novos, ver fome_zero/analytics.py)
+        ('principal/totais', lambda: SelectionTotals(country_cube).update(country_cube['Country Name']).stats()),
+        ('principal/map_points', lambda: map_points(ds, selection)),
+        ('principal/map_cells', lambda: map_cells(ds, selection)),
+        ('principal/export_csv', lambda: export_bytes(ds.select(selection), 'CSV')),
+        ('paises/country_stats', lambda: country_stats(ds, selection)),
+        ('cidades/city_rankings', lambda: city_rankings(ds, selection)),
+        ('restaurantes/rankings', lambda: restaurant_rankings(ds, selection)),
+        ('restaurantes/comparativos', lambda: (delivery_engagement(ds, selection), booking_cost(ds, selection),
+                                               usa_cuisine_costs(ds, selection))),
+        ('culinaria/cuisine_stats', lambda: cuisine_stats(ds, selection, cuisines)),
+        # HTML do mapa e figuras completas de cada página (cálculo + Plotly/Folium)
+        ('principal/map_html', lambda: map_html(ds, selection, False)),
+        ('principal/map_html_grid', lambda: map_html(ds, selection, True)),
+        *[(f'{page}/page_charts', partial(build_all, page_charts(page, ds, selection, cuisines)))
+          for page in CHART_PAGES],
+    ]
+
+def run(path=DATA_PATH, scales=DEFAULT_SCALES, repeat=DEFAULT_REPEAT):
+    """Tabela com uma linha por escala × etapa: linhas limpas, tempo (ms) e pico de memória (MB)."""
+    df_csv = read_csv(path)
+    read_time, read_peak = measure(lambda: read_csv(path), repeat)
+    results = [{'scale': 1, 'step': 'read_csv', 'rows': len(df_csv),
+                'ms': read_time * 1e3, 'peak_mb': read_peak / 2**20}]
+
+    for scale in scales:
+        df_raw = scale_raw(df_csv, scale)
+        steps = benchmarks(df_raw)
+        rows = len(clean_code(df_raw))
+        for name, func in steps:
+            seconds, peak = measure(func, repeat)
+            results.append({'scale': scale, 'step': name, 'rows': rows,
+                            'ms': seconds * 1e3, 'peak_mb': peak / 2**20})
+        del df_raw, steps
+
+    return pd.DataFrame(results)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', nargs='?', default=DATA_PATH, help='CSV de origem (padrão: data_set/zomato.csv)')
+    parser.add_argument('--scales', type=int, nargs='+', default=list(DEFAULT_SCALES))
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+    parser.add_argument('--output', help='grava a tabela de resultados neste CSV')
+    args = parser.parse_args(argv)
+
+    report = run(args.path, args.scales, args.repeat)
+    print(report.to_string(index=False, float_format='{:.2f}'.format))
+    if args.output:
+        report.to_csv(args.output, index=False)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+import streamlit as st
+
+from fome_zero.prerender import MISSING, prerendered_chart
+from fome_zero.timing import timed
+
+# ==============================================================================
+# Cache de figuras Plotly (compartilhado entre sessões)
+# ==============================================================================
+
+FIGURE_CACHE_ENTRIES = 256
+
+# cache_resource guarda o próprio objeto (sem cópia): st.plotly_chart serializa uma
+# go.Figure sem revalidá-la, o que não acontece com um dict/JSON guardado em cache_data.
+# As figuras devem ser tratadas como somente leitura pelas páginas.
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False)
+def _cached_chart(chart_id, selection, version, _ds, _build):
+    # Seleções pré-renderizadas em lote vêm do disco (ver fome_zero/prerender.py)
+    result = prerendered_chart(chart_id, selection, version)
+    if result is not MISSING:
+        return result
+    with timed(f'figura {chart_id}'):
+        return _build(_ds)
+
+def cached_chart(ds, chart_id, selection, build):
+    """Resultado de `build(ds)` (figura, ou tupla figura + dados) para o gráfico e a seleção.
+
+    `chart_id` identifica o gráfico (ex.: 'paises/votos') e `selection` é uma chave
+    hashable com tudo que o gráfico usa dos filtros; `ds.version` entra na chave
+    automaticamente. Chave e dados vêm do mesmo `Dataset`: uma sessão que ainda usa a
+    versão anterior grava com a versão anterior. `build` só é chamado quando a
+    combinação ainda não está em cache nem foi pré-renderizada.
+    """
+    return _cached_chart(chart_id, selection, ds.version, ds, build)
+
+def selection_key(*selections):
+    """Chave estável para listas de filtros (a ordem de escolha no multiselect não importa)."""
+    return tuple(tuple(sorted(selected)) for selected in selections)
@@ -0,0 +1,53 @@
+"""Compactação opcional do DataFrame limpo (categóricas e inteiros menores).
+
+Ative na aplicação com a variável de ambiente `FOME_ZERO_COMPACT=1`.
+Para ver quanto cada coluna economiza:
+
+    python -m fome_zero.compact
+"""
+import os
+
+import pandas as pd
+
+from fome_zero.timing import timed
+
+# Colunas de texto com menos valores distintos que esta fração das linhas viram categóricas
+CATEGORY_MAX_RATIO = 0.5
+
+def compaction_enabled():
+    return os.environ.get('FOME_ZERO_COMPACT', '').lower() in ('1', 'true', 'yes')
+
+@timed('compact_frame')
+def compact_frame(df):
+    """Cópia de `df` com texto repetitivo em categorias (códigos inteiros) e inteiros reduzidos.
+
+    Colunas float ficam como estão para não alterar as notas exibidas.
+    """
+    df_compact = df.copy()
+    for col in df_compact.columns:
+        values = df_compact[col]
+        if pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values):
+            if values.nunique() <= CATEGORY_MAX_RATIO * len(values):
+                df_compact[col] = values.astype('category')
+        elif pd.api.types.is_integer_dtype(values):
+            df_compact[col] = pd.to_numeric(values, downcast='integer')
+    return df_compact
+
+def memory_report(df_before, df_after):
+    """Bytes por coluna antes/depois da compactação, com total na última linha."""
+    report = pd.DataFrame({
+        'Antes': df_before.memory_usage(deep=True, index=False),
+        'Depois': df_after.memory_usage(deep=True, index=False),
+    })
+    report.loc['Total'] = report.sum()
+    report['Economia'] = report['Antes'] - report['Depois']
+    return report
+
+def main():
+    from fome_zero.data import read_dataset
+
+    df = read_dataset()
+    print(memory_report(df, compact_frame(df)).to_string())
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+from collections import Counter
+
+import pandas as pd
+
+from fome_zero.cuisines import explode_cuisines
+from fome_zero.timing import timed
+
+# ==============================================================================
+# Cubo por país
+# ==============================================================================
+
+# Contagens distintas ficam guardadas como conjuntos (cidades e códigos de culinária)
+# para que a união entre países continue correta; médias ficam como soma + quantidade.
+COUNTRY_SUMS = ['Restaurant ID', 'Is delivering now', 'Has Table booking', 'Price range 4',
+                'Votes', 'rating_sum', 'cost_sum']
+COUNTRY_SETS = ['city_set', 'cuisine_set']
+
+def _with_derived_columns(cube):
+    cube['City'] = cube['city_set'].map(len)
+    cube['Cuisines'] = cube['cuisine_set'].map(len)
+    cube['Aggregate rating'] = cube['rating_sum'] / cube['Restaurant ID']
+    cube['Average Cost for two'] = cube['cost_sum'] / cube['Restaurant ID']
+    return cube
+
+@timed('build_country_cube')
+def build_country_cube(df, cuisine_index):
+    """Uma linha por país com todas as métricas da página Países."""
+    grouped = df.assign(**{'Price range 4': df['Price range'] == 4}).groupby('Country Name', observed=True)
+    cube = grouped.agg(**{
+        'Restaurant ID': ('Restaurant ID', 'nunique'),
+        'Is delivering now': ('Is delivering now', 'sum'),
+        'Has Table booking': ('Has Table booking', 'sum'),
+        'Price range 4': ('Price range 4', 'sum'),
+        'Votes': ('Votes', 'sum'),
+        'rating_sum': ('Aggregate rating', 'sum'),
+        'cost_sum': ('Average Cost for two', 'sum'),
+    })
+    cube['city_set'] = grouped['City'].agg(frozenset)
+
+    df_cuisines = explode_cuisines(df, cuisine_index, ['Country Name'])
+    cube['cuisine_set'] = (df_cuisines.groupby('Country Name', observed=True)['Cuisines']
+                                      .agg(lambda s: frozenset(s.cat.codes)))
+
+    cube = _with_derived_columns(cube.reset_index())
+    cube['Country Name'] = cube['Country Name'].astype(str)
+    return cube
+
+def country_stats(cube, countries):
+    """Linhas do cubo para os países selecionados."""
+    return cube[cube['Country Name'].isin(countries)]
+
+class SelectionTotals:
+    """Total das linhas do cubo por país para uma seleção, atualizado por diferença.
+
+    Ao incluir/remover um país, só a linha dele é somada/subtraída. Contagens distintas
+    usam contadores (em quantos países selecionados cada cidade/culinária aparece),
+    que, ao contrário dos conjuntos, também admitem subtração.
+    """
+
+    def __init__(self, cube):
+        self.cube = cube
+        self._rows = cube.set_index('Country Name')
+        self.countries = frozenset()
+        self.sums = dict.fromkeys(COUNTRY_SUMS, 0)
+        self.counters = {col: Counter() for col in COUNTRY_SETS}
+
+    def _apply(self, country, sign):
+        row = self._rows.loc[country]
+        for col in COUNTRY_SUMS:
+            self.sums[col] += sign * row[col].item()
+        for col in COUNTRY_SETS:
+            counter = self.counters[col]
+            counter.update({key: sign for key in row[col]})
+            for key in row[col]:
+                if not counter[key]:
+                    del counter[key]
+
+    def update(self, countries):
+        """Passa para a seleção `countries` aplicando só os países que entraram ou saíram."""
+        countries = frozenset(countries) & frozenset(self._rows.index)
+        for country in countries - self.countries:
+            self._apply(country, 1)
+        for country in self.countries - countries:
+            self._apply(country, -1)
+        self.countries = countries
+        return self
+
+    def stats(self):
+        """Somas, contagens distintas e médias da seleção, mais a quantidade de países."""
+        total = pd.Series(self.sums, dtype=object)
+        n = total['Restaurant ID']
+        total['Country Name'] = len(self.countries)
+        total['City'] = len(self.counters['city_set'])
+        total['Cuisines'] = len(self.counters['cuisine_set'])
+        total['Aggregate rating'] = total['rating_sum'] / n if n else float('nan')
+        total['Average Cost for two'] = total['cost_sum'] / n if n else float('nan')
+        return total
+
+# ==============================================================================
+# Cubo por cidade
+# ==============================================================================
+
+CITY_KEYS = ['City', 'Country Name']
+
+@timed('build_city_cube')
+def build_city_cube(df, cuisine_index):
+    """Uma linha por cidade com todas as métricas da página Cidades."""
+    df_flags = df.assign(**{
+        'Rating above 4': df['Aggregate rating'] > 4,
+        'Rating below 2.5': df['Aggregate rating'] < 2.5,
+    })
+    cube = df_flags.groupby(CITY_KEYS, observed=True).agg(**{
+        'Restaurant ID': ('Restaurant ID', 'nunique'),
+        'Rating above 4': ('Rating above 4', 'sum'),
+        'Rating below 2.5': ('Rating below 2.5', 'sum'),
+        'Average Cost for two': ('Average Cost for two', 'mean'),
+        'Is delivering now': ('Is delivering now', 'sum'),
+        'Has Online delivery': ('Has Online delivery', 'sum'),
+        'Has Table booking': ('Has Table booking', 'sum'),
+    })
+    cube['Cuisines'] = (explode_cuisines(df, cuisine_index, CITY_KEYS)
+                        .groupby(CITY_KEYS, observed=True)['Cuisines'].nunique())
+
+    cube = cube.reset_index()
+    cube[CITY_KEYS] = cube[CITY_KEYS].astype(str)
+    return cube
+
+def city_stats(cube, countries):
+    """Linhas do cubo para as cidades dos países selecionados."""
+    return cube[cube['Country Name'].isin(countries)]
+
+def top_k(df_stats, col, k, drop_zero=False):
+    """As `k` maiores linhas por `col` com seleção parcial (`nlargest`), sem ordenar a tabela toda."""
+    if drop_zero:
+        df_stats = df_stats[df_stats[col] > 0]
+    return df_stats.nlargest(k, col).reset_index(drop=True)
@@ -0,0 +1,91 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from fome_zero.timing import timed
+
+# ==============================================================================
+# Tabela ponte restaurante × culinária
+# ==============================================================================
+
+# names: culinárias distintas (ordenadas), o código de cada uma é a sua posição
+# rows:  posição da linha do restaurante no DataFrame limpo
+# codes: código da culinária correspondente a cada entrada de `rows`
+# membership: um bitset por linha (palavras uint64, bit = código da culinária) para os
+#             filtros "contém alguma destas"; 1 bit por culinária em vez de 1 byte da matriz densa
+CuisineIndex = namedtuple('CuisineIndex', ['names', 'rows', 'codes', 'n_rows', 'membership'])
+
+WORD_BITS = 64
+
+def _n_words(n_cuisines):
+    return max(1, -(-n_cuisines // WORD_BITS))
+
+def _bits(codes):
+    """Bit de cada código dentro da sua palavra do bitset."""
+    return np.left_shift(np.uint64(1), (np.asarray(codes) % WORD_BITS).astype(np.uint64))
+
+@timed('build_cuisine_index')
+def build_cuisine_index(df, names=None):
+    """Separa as culinárias uma única vez e guarda o resultado com códigos inteiros.
+
+    Com `names` (todas as culinárias do dataset, ordenadas), os códigos seguem essa lista
+    mesmo que `df` tenha só parte dos países: categorias iguais às do DataFrame inteiro.
+    """
+    exploded = df['Cuisines'].str.split(', ').explode()
+    if names is None:
+        codes, names = pd.factorize(exploded, sort=True)
+    else:
+        names = pd.Index(names)
+        codes = names.get_indexer(exploded)
+    rows = exploded.index.to_numpy(dtype=np.int64)
+    membership = np.zeros((len(df), _n_words(len(names))), dtype=np.uint64)
+    np.bitwise_or.at(membership, (rows, codes // WORD_BITS), _bits(codes))
+    return CuisineIndex(
+        names=pd.Index(names, name='Cuisines'),
+        rows=rows,
+        codes=codes.astype(np.int32),
+        n_rows=len(df),
+        membership=membership,
+    )
+
+# ==============================================================================
+# Consultas
+# ==============================================================================
+
+def bridge_mask(df, index):
+    """Seleciona as entradas da ponte que pertencem às linhas de `df` (um recorte do DataFrame limpo)."""
+    selected = np.zeros(index.n_rows, dtype=bool)
+    selected[df.index.to_numpy()] = True
+    return selected[index.rows]
+
+def explode_cuisines(df, index, columns=None):
+    """Equivalente a explodir `Cuisines`, mas sem `str.split` nem cópia do DataFrame inteiro.
+
+    A coluna `Cuisines` volta como categórica (códigos inteiros); use `observed=True` nos groupbys.
+    """
+    mask = bridge_mask(df, index)
+    columns = [col for col in (columns or df.columns) if col != 'Cuisines']
+    df_exploded = df.loc[index.rows[mask], columns]
+    df_exploded['Cuisines'] = pd.Categorical.from_codes(index.codes[mask], categories=index.names)
+    return df_exploded
+
+def cuisine_codes(index, cuisines, partial=False):
+    """Códigos das culinárias pedidas; com `partial=True` casa por trecho do nome, sem diferenciar maiúsculas."""
+    if isinstance(cuisines, str):
+        cuisines = [cuisines]
+    if partial:
+        lowered = index.names.str.lower()
+        found = np.zeros(len(index.names), dtype=bool)
+        for name in cuisines:
+            found |= lowered.str.contains(name.lower(), regex=False)
+        return np.flatnonzero(found)
+    codes = index.names.get_indexer(cuisines)
+    return codes[codes >= 0]
+
+def has_any_cuisine(df, index, cuisines, partial=False):
+    """Máscara (alinhada a `df`) dos restaurantes que servem ao menos uma das culinárias."""
+    codes = cuisine_codes(index, cuisines, partial)
+    query = np.zeros(index.membership.shape[1], dtype=np.uint64)
+    np.bitwise_or.at(query, codes // WORD_BITS, _bits(codes))
+    return (index.membership[df.index.to_numpy()] & query).any(axis=1)
@@ -0,0 +1,150 @@
+import importlib.util
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from fome_zero.compact import compact_frame, compaction_enabled
+from fome_zero.schema import columns_of_kind, csv_columns, csv_dtypes
+from fome_zero.timing import timed
+
+# ==============================================================================
+# Configurações
+# ==============================================================================
+
+DATA_PATH = Path(__file__).resolve().parent.parent / 'data_set' / 'zomato.csv'
+
+COUNTRIES = {
+    1: 'India', 14: 'Australia', 30: 'Brazil', 37: 'Canada', 94: 'Indonesia',
+    148: 'New Zealand', 162: 'Philippines', 166: 'Qatar', 184: 'Singapore',
+    189: 'South Africa', 191: 'Sri Lanka', 208: 'Turkey',
+    214: 'United Arab Emirates', 215: 'United Kingdom', 216: 'United States'
+}
+
+# Coordenadas chegam como '144.476.149.305' (pontos de milhar, 10 casas decimais implícitas);
+# o esquema as lê como texto para não passarem por float no read_csv
+COORDINATE_SCALE = 10**10
+
+# Versão do formato gravado no snapshot; incremente quando a saída de clean_code mudar
+SNAPSHOT_VERSION = 3
+
+# Engine pyarrow do read_csv quando disponível (leitura multithread)
+CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') else 'c'
+
+def country_name(country_id):
+    return COUNTRIES.get(country_id, "Unknown")
+
+# ==============================================================================
+# Limpeza
+# ==============================================================================
+
+def decode_coordinates(values, limit):
+    """Converte '144.476.149.305' em 14.4476149305; fora de [-limit, limit], vazio ou zerado vira NaN."""
+    digits = values.astype(str).str.replace('.', '', regex=False)
+    degrees = pd.to_numeric(digits, errors='coerce') / COORDINATE_SCALE
+    # 0 exato é marcador de coordenada ausente no dataset (ex.: latitude de Perth)
+    return degrees.where(degrees.between(-limit, limit) & (degrees != 0))
+
+@timed('clean_code')
+def clean_code(df):
+    """Limpeza única usada por todas as páginas (resulta nos 6.929 restaurantes)."""
+    df_processing = df.copy()
+
+    # 1. Criação da coluna de Países
+    df_processing['Country Name'] = df_processing['Country Code'].map(country_name)
+
+    # 2. Tratamento de Coordenadas (inválidas ficam NaN e sinalizadas, sem descartar o restaurante)
+    df_processing['Latitude'] = decode_coordinates(df_processing['Latitude'], 90)
+    df_processing['Longitude'] = decode_coordinates(df_processing['Longitude'], 180)
+    df_processing['Valid coordinates'] = df_processing['Latitude'].notna() & df_processing['Longitude'].notna()
+
+    # 3. Remoção de linhas incompletas (15 restaurantes sem culinária); só as colunas das
+    # páginas contam, assim a leitura completa (download) mantém os mesmos restaurantes
+    required = [col for col in csv_columns() if col in df_processing.columns]
+    df_processing = df_processing.dropna(subset=[col for col in required if col not in columns_of_kind('coordinate')])
+
+    # 4. Limpeza de Strings (Remoção de espaços)
+    for col in df_processing.select_dtypes(include=['object', 'string']).columns:
+        df_processing[col] = df_processing[col].astype(str).str.strip()
+
+    # 5. Remoção de duplicadas pelo ID
+    df_processing = df_processing.drop_duplicates(subset='Restaurant ID', keep='first')
+
+    # 6. Conversão de tipos
+    for col in columns_of_kind('flag'):
+        if col in df_processing.columns:
+            df_processing[col] = df_processing[col].astype(bool)
+
+    for col in columns_of_kind('category'):
+        if col in df_processing.columns:
+            df_processing[col] = df_processing[col].astype('category')
+
+    return df_processing.reset_index(drop=True)
+
+# ==============================================================================
+# Leitura dos arquivos
+# ==============================================================================
+
+@timed('read_csv')
+def read_csv(path=DATA_PATH, download=False):
+    """Lê só as colunas usadas pelas páginas (`download=True`: todas), com os tipos do esquema."""
+    columns = csv_columns(download)
+    return pd.read_csv(path, usecols=columns, dtype=csv_dtypes(columns), engine=CSV_ENGINE)
+
+def snapshot_path(path=DATA_PATH):
+    return os.path.splitext(str(path))[0] + f'.v{SNAPSHOT_VERSION}.feather'
+
+def shards_dir(path=DATA_PATH):
+    """Partições por país (ver fome_zero/shards.py)."""
+    return os.path.splitext(str(path))[0] + f'.v{SNAPSHOT_VERSION}.shards'
+
+def manifest_path(path=DATA_PATH):
+    return os.path.join(shards_dir(path), 'manifest.json')
+
+def snapshot_is_fresh(path=DATA_PATH):
+    """O snapshot só é usado quando existe e é mais novo que o CSV de origem."""
+    snap = snapshot_path(path)
+    return os.path.exists(snap) and os.stat(snap).st_mtime_ns >= os.stat(path).st_mtime_ns
+
+@timed('read_dataset')
+def read_dataset(path=DATA_PATH):
+    """Lê o snapshot colunar quando estiver atualizado; caso contrário, o CSV."""
+    if snapshot_is_fresh(path):
+        try:
+            from pyarrow import feather
+
+            # memory_map evita copiar o arquivo inteiro para a memória na leitura
+            return feather.read_table(snapshot_path(path), memory_map=True).to_pandas()
+        except (ImportError, OSError, ValueError):
+            # pyarrow ausente ou snapshot corrompido: segue pelo CSV
+            pass
+    return clean_code(read_csv(path))
+
+def load_frame(path=DATA_PATH):
+    """DataFrame limpo das páginas, compactado quando `FOME_ZERO_COMPACT=1` (sem cache)."""
+    df = read_dataset(path)
+    return compact_frame(df) if compaction_enabled() else df
+
+def read_full(path=DATA_PATH):
+    """Como `load_frame`, mas com todas as colunas do CSV (endereços etc.); usado no download."""
+    return clean_code(read_csv(path, download=True))
+
+def file_version(path=DATA_PATH):
+    """Identifica a versão dos arquivos em disco (mtime/tamanho do CSV, mtime do snapshot e do manifesto das partições)."""
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    for derived in (snapshot_path(path), manifest_path(path)):
+        version += (os.stat(derived).st_mtime_ns if os.path.exists(derived) else None,)
+    return version
+
+def read_version(path=DATA_PATH, read=load_frame):
+    """Devolve `(versão, read(path))`, com a versão dos arquivos que foram de fato lidos.
+
+    Confere `file_version` antes e depois da leitura e lê de novo se o arquivo foi
+    trocado no meio dela.
+    """
+    while True:
+        version = file_version(path)
+        df = read(path)
+        if file_version(path) == version:
+            return version, df
@@ -0,0 +1,30 @@
+import gzip
+import io
+
+from fome_zero.timing import timed
+
+# ==============================================================================
+# Exportação dos dados tratados
+# ==============================================================================
+
+# Formato -> (extensão do arquivo, MIME type)
+EXPORT_FORMATS = {
+    'CSV': ('csv', 'text/csv'),
+    'CSV (gzip)': ('csv.gz', 'application/gzip'),
+    'Parquet': ('parquet', 'application/vnd.apache.parquet'),
+}
+
+@timed('export_bytes')
+def export_bytes(df, fmt):
+    """Conteúdo do arquivo de download no formato escolhido (chave de `EXPORT_FORMATS`).
+
+    O `st.download_button` guarda o arquivo inteiro em memória antes de enviá-lo,
+    por isso o conteúdo é gerado de uma vez, sem buffers intermediários.
+    """
+    if fmt == 'Parquet':
+        buffer = io.BytesIO()
+        df.to_parquet(buffer, index=False)
+        return buffer.getvalue()
+
+    content = df.to_csv(index=False).encode('utf-8')
+    return gzip.compress(content) if fmt == 'CSV (gzip)' else content
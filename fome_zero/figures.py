@@ -0,0 +1,422 @@
+"""Figuras Plotly de cada página, montadas a partir dos resultados de fome_zero/analytics.py.
+
+Não dependem do Streamlit: as páginas guardam as figuras em cache com `cached_chart`
+(fome_zero/charts.py) e o pré-renderizador (fome_zero/prerender.py) as grava em disco
+com os mesmos identificadores (`page_charts`).
+"""
+from functools import partial
+
+import pandas as pd
+import plotly.express as px
+
+from fome_zero.analytics import (CITY_RANKINGS, HIGHLIGHT_CUISINES, booking_cost, city_ranking, country_stats,
+                                 cuisine_extremes, cuisine_ratings, delivery_cuisines, delivery_engagement,
+                                 expensive_cuisines, rank_countries, restaurant_ranking, usa_cuisine_costs)
+
+# ==============================================================================
+# Países
+# ==============================================================================
+
+def country_bar_chart(df, x_val, y_val, title, color, text_format='.2s'):
+    """Cria um gráfico de barras padronizado para o dashboard."""
+    fig = px.bar(
+        df, x=x_val, y=y_val, text=y_val,
+        labels={x_val: 'País', y_val: title},
+        color_discrete_sequence=[color]
+    )
+    fig.update_traces(textposition='outside', texttemplate='%{text:' + text_format + '}')
+    fig.update_layout(xaxis_title=None, yaxis_title=None, showlegend=False, margin=dict(t=30, b=0))
+    return fig
+
+# Gráfico -> (métrica, rótulo, cor, formato dos valores, opções do ranking: ascending/drop_zero/head)
+COUNTRY_CHARTS = {
+    'cidades': ('City', 'Cidades', '#2C3E50', '.0f', {}),
+    'rest': ('Restaurant ID', 'Restaurantes', '#E67E22', '.0f', {}),
+    'del': ('Is delivering now', 'Entrega', '#E74C3C', '.0f', {'drop_zero': True}),
+    'res': ('Has Table booking', 'Reserva', '#8E44AD', '.0f', {'drop_zero': True}),
+    'cui_dist': ('Cuisines', 'Culinárias', '#27AE60', '.0f', {}),
+    'votes': ('Votes', 'Votos', '#3498DB', '.2s', {}),
+    'top': ('Aggregate rating', 'Nota', '#27AE60', '.2f', {'head': 10}),
+    'low': ('Aggregate rating', 'Nota', '#C0392B', '.2f', {'ascending': True, 'head': 10}),
+    'p4': ('Price range 4', 'Qtd.', '#1ABC9C', '.0f', {'drop_zero': True}),
+    'cost': ('Average Cost for two', 'Preço', '#34495E', '.2f', {}),
+}
+
+# Gráficos de cada aba, na ordem em que aparecem
+TAB_CHARTS = (['cidades', 'rest', 'del', 'res', 'cui_dist'], ['votes', 'top', 'low', 'p4', 'cost'])
+
+def country_ranking(name, df_countries):
+    """Ranking dos países (linhas de `country_stats`) para o gráfico `name` de COUNTRY_CHARTS."""
+    col, _, _, _, options = COUNTRY_CHARTS[name]
+    df_rank = rank_countries(df_countries, col, options.get('ascending', False), options.get('drop_zero', False))
+    if 'head' in options:
+        df_rank = df_rank.head(options['head'])
+    return df_rank
+
+def country_figure(name, df_rank):
+    col, title, color, text_format, _ = COUNTRY_CHARTS[name]
+    return country_bar_chart(df_rank, 'Country Name', col, title, color, text_format)
+
+# ==============================================================================
+# Cidades
+# ==============================================================================
+
+def city_bar_chart(df, x_val, y_val, label_y, text_format='.2s', color_col='Country Name'):
+    """
+    Cria um gráfico de barras com legenda por país.
+    """
+    fig = px.bar(
+        df,
+        x=x_val,
+        y=y_val,
+        color=color_col,
+        text=y_val,
+        labels={x_val: 'Cidade', y_val: label_y, color_col: 'País'},
+        color_discrete_sequence=px.colors.qualitative.Safe
+    )
+
+    fig.update_traces(textposition='outside', texttemplate='%{text:' + text_format + '}')
+    fig.update_layout(
+        xaxis_title=None,
+        yaxis_title=None,
+        legend_title_text='País',
+        margin=dict(t=30, b=0)
+    )
+    return fig
+
+# Rótulo do eixo e formato dos valores de cada gráfico (um por ranking de CITY_RANKINGS)
+CITY_CHARTS = {
+    'restaurantes': ('Qtd Restaurantes', '.0f'),
+    'notas_altas': ('Restaurantes > 4', '.0f'),
+    'notas_baixas': ('Restaurantes < 2.5', '.0f'),
+    'preco': ('Preço Médio', '.2f'),
+    'diversidade': ('Tipos de Culinária', '.0f'),
+    'entregando': ('Entregas', '.0f'),
+    'online': ('Online', '.0f'),
+    'reserva': ('Reservas', '.0f'),
+}
+
+def city_figure(name, df_rank):
+    label_y, text_format = CITY_CHARTS[name]
+    return city_bar_chart(df_rank, 'City', CITY_RANKINGS[name][0], label_y, text_format)
+
+# ==============================================================================
+# Restaurantes
+# ==============================================================================
+
+def plot_usa_cuisine_comparison(jp_avg, bbq_avg):
+    """Gera o comparativo de custo entre comida Japonesa e BBQ nos EUA 🥩🍣"""
+    # 1. Médias já calculadas (ver usa_cuisine_costs em fome_zero/analytics.py); NaN = sem dados
+    df_comp = pd.DataFrame({
+        'Culinária': ['Japonesa 🍣', 'BBQ (Churrasco) 🥩'],
+        'Preço Médio': [jp_avg, bbq_avg]
+    }).dropna()
+
+    if df_comp.empty:
+        return None, None, None
+
+    # 2. Construção do Gráfico
+    fig = px.bar(
+        df_comp, x='Culinária', y='Preço Médio', color='Culinária',
+        text='Preço Médio', height=500,
+        color_discrete_map={'Japonesa 🍣': '#FF4B4B', 'BBQ (Churrasco) 🥩': '#6D4C41'}
+    )
+
+    fig.update_traces(textposition='outside', texttemplate='$ %{text:.2f}', width=0.4)
+    fig.update_layout(
+        xaxis_title=None,
+        yaxis_title="Preço Médio (USD)",
+        showlegend=False,
+        margin=dict(t=50, b=50)
+    )
+
+    return fig, jp_avg, bbq_avg
+
+
+def plot_booking_vs_cost(df_booking):
+    """Gera o comparativo de preço entre restaurantes que aceitam ou não reserva 📅"""
+    # 1. Médias já calculadas (ver booking_cost em fome_zero/analytics.py)
+
+    # Mapeando labels e adicionando emojis para o gráfico
+    df_booking['Reserva'] = df_booking['Has Table booking'].map({
+        True: 'Faz Reserva 📅',
+        False: 'Não Faz Reserva 🍽️'
+    })
+
+    # 2. Criação do Gráfico
+    fig = px.bar(
+        df_booking,
+        x='Reserva',
+        y='Average Cost for two',
+        color='Reserva',
+        text='Average Cost for two',
+        height=500,
+        labels={'Reserva': 'Serviço de Reserva', 'Average Cost for two': 'Preço Médio (2 pessoas)'},
+        color_discrete_map={'Faz Reserva 📅': '#3498DB', 'Não Faz Reserva 🍽️': '#95A5A6'}
+    )
+
+    # 3. Ajustes de Layout
+    fig.update_traces(textposition='outside', texttemplate='%{text:,.2f}', width=0.4)
+    fig.update_layout(
+        xaxis_title=None,
+        yaxis_title="Preço Médio (Moeda Local)",
+        showlegend=False,
+        margin=dict(t=50, b=50)
+    )
+
+    return fig, df_booking
+
+
+def plot_top_luxury_restaurants(df_max_cost):
+    """Gera o gráfico horizontal dos 10 restaurantes mais caros 💎"""
+    # 1. Dados já ranqueados (ver restaurant_ranking em fome_zero/analytics.py)
+    if df_max_cost.empty:
+        return None, None
+
+    # 2. Criação do Gráfico de Barras Horizontais
+    fig = px.bar(
+        df_max_cost,
+        x='Average Cost for two',
+        y='Restaurant Name',
+        color='Country Name',
+        text='Average Cost for two',
+        orientation='h',
+        height=500,
+        labels={'Average Cost for two': 'Custo para Dois', 'Restaurant Name': 'Restaurante', 'Country Name': 'País'},
+        color_discrete_sequence=px.colors.qualitative.Prism
+    )
+
+    # 3. Ajustes de Layout e Posicionamento do Texto
+    fig.update_traces(
+        textposition='outside',
+        texttemplate='%{text:,.2f}',
+        cliponaxis=False
+    )
+
+    fig.update_layout(
+        xaxis_range=[0, df_max_cost['Average Cost for two'].max() * 1.25], # Espaço para o texto
+        yaxis={'categoryorder': 'total ascending'},
+        xaxis_title="Custo (Moeda Local)",
+        yaxis_title=None,
+        margin=dict(t=30, b=30)
+    )
+
+    return fig, df_max_cost
+
+
+def plot_delivery_engagement(df_delivery):
+    """Gera o gráfico de engajamento (soma de votos) por disponibilidade de delivery 🚚"""
+    # 1. Soma de votos já calculada (ver delivery_engagement em fome_zero/analytics.py)
+
+    # Mapeando labels e adicionando emojis
+    df_delivery['Delivery'] = df_delivery['Has Online delivery'].map({
+        True: 'Aceita Online 🚚',
+        False: 'Apenas Presencial 🍽️'
+    })
+
+    # 2. Criação do Gráfico
+    fig = px.bar(
+        df_delivery,
+        x='Delivery',
+        y='Votes',
+        color='Delivery',
+        text='Votes',
+        labels={'Delivery': 'Tipo de Serviço', 'Votes': 'Soma Total de Votos'},
+        color_discrete_map={'Aceita Online 🚚': '#2ECC71', 'Apenas Presencial 🍽️': '#E74C3C'}
+    )
+
+    # 3. Ajustes de Layout (Formatação .2s para números grandes como 100k)
+    fig.update_traces(textposition='outside', texttemplate='%{text:.2s}')
+    fig.update_layout(
+        xaxis_title=None,
+        yaxis_title="Total de Votos Acumulados",
+        showlegend=False,
+        margin=dict(t=20, b=20)
+    )
+
+    return fig, df_delivery
+
+def plot_best_brazilian_ratings(df_br_top):
+    """Gera o ranking das melhores notas de culinária brasileira no Brasil 🇧🇷"""
+    # 1. Dados já ranqueados (ver restaurant_ranking em fome_zero/analytics.py)
+    if df_br_top.empty:
+        return None, None
+
+    # 2. Criação do Gráfico (Usando tons de verde/amarelo para o Brasil)
+    fig = px.bar(
+        df_br_top,
+        x='Restaurant Name',
+        y='Aggregate rating',
+        text='Aggregate rating',
+        labels={'Restaurant Name': 'Restaurante', 'Aggregate rating': 'Nota Média'},
+        color_discrete_sequence=['#228B22'] # Verde floresta
+    )
+
+    fig.update_traces(textposition='outside', texttemplate='%{text:.1f}')
+    fig.update_layout(
+        xaxis_title=None,
+        yaxis_title="Nota (0-5)",
+        margin=dict(t=20, b=20),
+        yaxis_range=[0, 5.5] # Garante que o texto da nota apareça
+    )
+
+    return fig, df_br_top
+
+def plot_lowest_brazilian_ratings(df_br_low):
+    """Gera o gráfico horizontal das menores notas da culinária brasileira 📉"""
+    # 1. Dados já ranqueados (ver restaurant_ranking em fome_zero/analytics.py)
+    if df_br_low.empty:
+        return None, None
+
+    # 3. Formatação do Eixo Y (Nome do Restaurante - Nota)
+    df_br_low['Nome com Nota'] = df_br_low.apply(lambda x: f"{x['Restaurant Name']} - {x['Aggregate rating']:.1f}", axis=1)
+
+    # 4. Geração do gráfico
+    fig = px.bar(
+        df_br_low,
+        x='Aggregate rating',
+        y='Nome com Nota',
+        color='Country Name',
+        orientation='h',
+        labels={'Aggregate rating': 'Nota Média', 'Nome com Nota': 'Restaurante', 'Country Name': 'País'},
+        color_discrete_sequence=px.colors.qualitative.Pastel
+    )
+
+    # 5. Ajustes de Layout
+    fig.update_layout(
+        xaxis_range=[0, 5],
+        yaxis={'categoryorder': 'total descending'},
+        xaxis_title="Nota Média",
+        yaxis_title=None,
+        margin=dict(t=20, b=20)
+    )
+
+    return fig, df_br_low
+
+def top_rated_table(df_best):
+    """Tabela dos 20 restaurantes com maiores notas ⭐, com as colunas renomeadas para exibição."""
+    return df_best.set_axis(['ID', 'Restaurante', 'País', 'Cidade', 'Culinária', 'Nota Média'], axis=1)
+
+# Gráfico -> (dados a partir de `ds` e da seleção de países, figura (ou tabela) a partir dos dados)
+RESTAURANT_CHARTS = {
+    'votos': (partial(restaurant_ranking, name='voted'),
+              lambda df: (city_bar_chart(df, 'Restaurant Name', 'Votes', 'Total de Votos', '.2s'), df)),
+    'tabela-notas': (partial(restaurant_ranking, name='rated'), top_rated_table),
+    'menores-notas-br': (partial(restaurant_ranking, name='brazilian_worst'), plot_lowest_brazilian_ratings),
+    'melhores-notas-br': (partial(restaurant_ranking, name='brazilian_best'), plot_best_brazilian_ratings),
+    'delivery': (delivery_engagement, plot_delivery_engagement),
+    'luxo': (partial(restaurant_ranking, name='costly'), plot_top_luxury_restaurants),
+    'reserva': (booking_cost, plot_booking_vs_cost),
+    'eua': (usa_cuisine_costs, lambda costs: plot_usa_cuisine_comparison(*costs)),
+}
+
+def build_restaurant_chart(ds, countries, name):
+    """Resultado do gráfico `name` de RESTAURANT_CHARTS (figura, figura + dados do insight, ou tabela)."""
+    compute, plot = RESTAURANT_CHARTS[name]
+    return plot(compute(ds, countries))
+
+# ==============================================================================
+# Culinárias
+# ==============================================================================
+
+def plot_expensive_cuisines(df_price):
+    """Gera gráfico das 10 culinárias individuais com maior custo médio 💰"""
+    if df_price.empty: return None
+
+    fig = px.bar(df_price, x='Average Cost for two', y='Cuisines', orientation='h',
+                 text='Average Cost for two', title="Top 10 Culinárias mais Caras para Duas Pessoas",
+                 labels={'Average Cost for two': 'Custo Médio', 'Cuisines': 'Culinária'},
+                 color='Average Cost for two', color_continuous_scale='Reds')
+
+    fig.update_traces(texttemplate='%{text:,.2f}', textposition='outside')
+    fig.update_layout(yaxis={'categoryorder': 'total ascending'}, xaxis_title="Custo Médio (Moeda Local)", yaxis_title=None)
+    return fig
+
+def plot_cuisine_ratings(df_plot, top=True):
+    """Gera gráfico vertical das 10 melhores ou piores culinárias individuais ⭐"""
+    # Só culinárias com mais de 5 restaurantes (ver cuisine_ratings em fome_zero/analytics.py)
+    if df_plot.empty: return None
+
+    color_scale = 'Viridis' if top else 'Reds_r'
+    title = "Top 10 Culinárias com Melhores Notas" if top else "Top 10 Culinárias com Menores Notas"
+
+    fig = px.bar(df_plot, x='Cuisines', y='Aggregate rating', text='Aggregate rating',
+                 title=title, labels={'Aggregate rating': 'Nota Média', 'Cuisines': 'Culinária'},
+                 color='Aggregate rating', color_continuous_scale=color_scale)
+
+    fig.update_traces(texttemplate='%{text:.2f}', textposition='outside')
+    fig.update_layout(xaxis_tickangle=-45, yaxis_range=[0, 5.5], xaxis_title=None, showlegend=False)
+    return fig
+
+
+def plot_online_delivery_cuisines(df_counts):
+    """Gera gráfico das culinárias com maior volume de entrega online ativa 🚚"""
+    # 1. Contagem já feita sobre os restaurantes que aceitam pedido online E estão entregando agora
+    if df_counts.empty:
+        return None
+
+    # 2. Criação do Gráfico
+    fig = px.bar(
+        df_counts,
+        x='Quantidade',
+        y='Cuisines',
+        orientation='h',
+        text='Quantidade',
+        title="Top 10 Culinárias com Maior Disponibilidade de Entrega Online",
+        labels={'Quantidade': 'Número de Restaurantes', 'Cuisines': 'Culinária'},
+        color='Quantidade',
+        color_continuous_scale='GnBu' # Tons de verde/azul para serviço
+    )
+
+    fig.update_traces(textposition='outside')
+    fig.update_layout(yaxis={'categoryorder': 'total ascending'}, showlegend=False)
+
+    return fig
+
+# Gráfico -> (dados a partir de `ds` e dos filtros de país e culinária, figura a partir dos dados;
+# None quando a página usa só os dados)
+CUISINE_CHARTS = {
+    'custo': (expensive_cuisines, plot_expensive_cuisines),
+    'melhores-notas': (partial(cuisine_ratings, top=True), partial(plot_cuisine_ratings, top=True)),
+    'menores-notas': (partial(cuisine_ratings, top=False), partial(plot_cuisine_ratings, top=False)),
+    # O insight considera todas as culinárias com votos, mesmo as com poucos restaurantes
+    'menor-nota': (partial(cuisine_ratings, top=False, k=1, min_restaurants=0), None),
+    'delivery': (delivery_cuisines, plot_online_delivery_cuisines),
+}
+
+# Cards da aba de avaliações: (melhor, pior) restaurante de cada culinária em destaque, sem figura
+CUISINE_HIGHLIGHTS = {f'destaque-{name}': (partial(cuisine_extremes, cuisine_name=name), None)
+                      for name in HIGHLIGHT_CUISINES}
+
+# ==============================================================================
+# Todos os gráficos de uma página
+# ==============================================================================
+
+# Cada `build_*` calcula os dados e monta a figura juntos: o par (dados, figura) é o valor
+# guardado em cache, e uma seleção repetida não refaz nem a agregação nem a figura
+
+def build_country_chart(ds, countries, name):
+    df_rank = country_ranking(name, country_stats(ds, countries))
+    return df_rank, country_figure(name, df_rank)
+
+def build_city_chart(ds, countries, name):
+    df_rank = city_ranking(ds, countries, name)
+    return df_rank, city_figure(name, df_rank)
+
+def build_cuisine_chart(ds, countries, cuisines, name):
+    compute, plot = {**CUISINE_CHARTS, **CUISINE_HIGHLIGHTS}[name]
+    df_chart = compute(ds, countries, cuisines)
+    return df_chart if plot is None else (df_chart, plot(df_chart))
+
+def page_charts(page, ds, countries, cuisines=()):
+    """Gráficos da página para a seleção: `chart_id` -> função sem argumentos que devolve
+    o mesmo resultado que a página guarda com `cached_chart`."""
+    if page == 'culinaria':
+        return {f'culinaria/{name}': partial(build_cuisine_chart, ds, countries, cuisines, name)
+                for name in [*CUISINE_CHARTS, *CUISINE_HIGHLIGHTS]}
+    build, names = {
+        'paises': (build_country_chart, COUNTRY_CHARTS),
+        'cidades': (build_city_chart, CITY_CHARTS),
+        'restaurantes': (build_restaurant_chart, RESTAURANT_CHARTS),
+    }[page]
+    return {f'{page}/{name}': partial(build, ds, countries, name) for name in names}
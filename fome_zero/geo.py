@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+from fome_zero.timing import timed
+
+# ==============================================================================
+# Agregação em grade por nível de zoom
+# ==============================================================================
+
+# Níveis de zoom (Leaflet) com grade própria; cada célula ocupa ~1/4 de um tile de 256px
+GRID_ZOOMS = (0, 2, 4, 6, 8, 10)
+
+CELL_KEYS = ['zoom', 'cell_lat', 'cell_lon']
+
+def cell_size(zoom):
+    """Tamanho da célula da grade, em graus, para o nível de zoom."""
+    return 90 / 2 ** zoom
+
+@timed('build_grid_cube')
+def build_grid_cube(df):
+    """Somas por país × zoom × célula × cor, prontas para serem combinadas entre países."""
+    df = df[df['Valid coordinates']]
+    parts = []
+    for zoom in GRID_ZOOMS:
+        size = cell_size(zoom)
+        df_zoom = df.assign(
+            zoom=zoom,
+            cell_lat=np.floor(df['Latitude'] / size).astype(np.int32),
+            cell_lon=np.floor(df['Longitude'] / size).astype(np.int32),
+        )
+        parts.append(df_zoom.groupby(['Country Name', *CELL_KEYS, 'Rating color'], observed=True)
+                            .agg(n=('Restaurant ID', 'size'),
+                                 rating_sum=('Aggregate rating', 'sum'),
+                                 lat_sum=('Latitude', 'sum'),
+                                 lon_sum=('Longitude', 'sum')))
+    return pd.concat(parts).reset_index()
+
+def grid_cells(cube, countries):
+    """Células dos países selecionados: quantidade, centro, nota média e cor predominante."""
+    df_sel = cube[cube['Country Name'].isin(countries)]
+
+    # Cor predominante = cor com mais restaurantes dentro da célula
+    per_color = df_sel.groupby([*CELL_KEYS, 'Rating color'], observed=True)['n'].sum().reset_index()
+    dominant = (per_color.sort_values('n', ascending=False, kind='stable')
+                         .drop_duplicates(CELL_KEYS)
+                         .drop(columns='n'))
+
+    cells = df_sel.groupby(CELL_KEYS)[['n', 'rating_sum', 'lat_sum', 'lon_sum']].sum().reset_index()
+    cells['Latitude'] = cells['lat_sum'] / cells['n']
+    cells['Longitude'] = cells['lon_sum'] / cells['n']
+    cells['Aggregate rating'] = cells['rating_sum'] / cells['n']
+    cells = cells.merge(dominant, on=CELL_KEYS)
+    return cells[['zoom', 'Latitude', 'Longitude', 'n', 'Aggregate rating', 'Rating color']]
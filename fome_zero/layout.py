@@ -0,0 +1,49 @@
+from pathlib import Path
+
+import streamlit as st
+from PIL import Image
+
+from fome_zero.timing import finish_page, profiling_enabled
+
+# ==============================================================================
+# Elementos comuns às páginas
+# ==============================================================================
+
+LOGO_PATH = Path(__file__).resolve().parent.parent / 'logo1.png'
+
+@st.cache_resource(show_spinner=False)
+def load_logo(path=LOGO_PATH):
+    """Logo decodificado uma vez por processo (None se o arquivo não existir ou for inválido)."""
+    try:
+        with Image.open(path) as logo:
+            return logo.copy()
+    except OSError:
+        return None
+
+def sidebar_header():
+    """Logo + nome do projeto no topo da barra lateral."""
+    col1, col2 = st.sidebar.columns([1, 4])
+    logo = load_logo()
+    if logo is not None:
+        col1.image(logo, width=100)
+    else:
+        col1.warning("!")
+    col2.markdown("### Fome Zero")
+
+def stateful_tabs(labels, key):
+    """Abas com estado: só o conteúdo da aba aberta é executado a cada rerun.
+
+    Trocar de aba reexecuta a página (ou o fragmento que criou as abas); dentro de cada
+    `with tab:`, coloque o conteúdo em `if tab.open:` para pular as abas fechadas.
+    """
+    return st.tabs(labels, key=key, on_change='rerun')
+
+def performance_expander():
+    """Etapas medidas no rerun (só com FOME_ZERO_PROFILE=1, ver fome_zero/timing.py); chame no fim da página."""
+    df_steps = finish_page()
+    if not profiling_enabled():
+        return
+    with st.sidebar.expander("⏱️ Desempenho"):
+        st.caption(f"Total medido: {df_steps['seconds'].sum() * 1e3:.0f} ms (etapas aninhadas somam mais de uma vez)")
+        st.dataframe(df_steps.assign(ms=df_steps['seconds'] * 1e3)[['step', 'ms', 'rows']],
+                     hide_index=True, width='stretch')
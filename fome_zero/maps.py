@@ -0,0 +1,103 @@
+"""Mapa Folium dos restaurantes (pontos ou grade agregada), gerado como HTML sem Streamlit."""
+import folium
+from branca.element import MacroElement
+from folium.plugins import FastMarkerCluster
+from jinja2 import Template
+
+from fome_zero.analytics import map_cells, map_center, map_points
+from fome_zero.timing import timed
+
+# ==============================================================================
+# Mapa interativo
+# ==============================================================================
+
+# Monta marcador, ícone e popup no navegador a partir de cada linha de `data` (MAP_COLUMNS em fome_zero/analytics.py)
+MARKER_CALLBACK = """
+    var callback = function (row) {
+        var esc = function (value) {
+            return String(value).replace(/[&<>"']/g, function (c) {
+                return {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c];
+            });
+        };
+        var icon = L.AwesomeMarkers.icon({icon: 'utensils', prefix: 'fa', markerColor: row[7]});
+        var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icon});
+        marker.bindPopup(
+            '<div style="width: 200px">' +
+                '<b>' + esc(row[2]) + '</b><br>' +
+                '<i>' + esc(row[3]) + '</i><br><br>' +
+                '<b>Nota:</b> ' + row[4] + ' / 5.0<br>' +
+                '<b>Preço para dois:</b> ' + row[5] + ' (' + esc(row[6]) + ')' +
+            '</div>',
+            {maxWidth: 300}
+        );
+        return marker;
+    };
+"""
+
+# Acima deste número de restaurantes o modo automático mostra o mapa agregado em grade
+MAP_POINT_LIMIT = 10_000
+
+class GridLayer(MacroElement):
+    """Uma camada de círculos por nível de zoom; o navegador exibe a do zoom atual."""
+
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+        (function () {
+            var map = {{ this._parent.get_name() }};
+            var levels = {{ this.levels|tojson }};
+            var layers = levels.map(function (level) {
+                var group = L.layerGroup();
+                level[1].forEach(function (c) {
+                    L.circleMarker([c[0], c[1]], {
+                        radius: 6 + 3 * Math.log(c[2]), weight: 1,
+                        color: '#' + c[4], fillColor: '#' + c[4], fillOpacity: 0.6
+                    }).bindTooltip(c[2] + ' restaurantes<br>Nota média: ' + c[3].toFixed(2)).addTo(group);
+                });
+                return group;
+            });
+            var update = function () {
+                var active = 0;
+                levels.forEach(function (level, i) { if (map.getZoom() >= level[0]) { active = i; } });
+                layers.forEach(function (layer, i) {
+                    if (i === active) { map.addLayer(layer); } else { map.removeLayer(layer); }
+                });
+            };
+            map.on('zoomend', update);
+            update();
+        })();
+        {% endmacro %}
+    """)
+
+    def __init__(self, df_cells):
+        super().__init__()
+        self._name = 'GridLayer'
+        columns = ['Latitude', 'Longitude', 'n', 'Aggregate rating', 'Rating color']
+        self.levels = [[int(zoom), cells[columns].astype(object).values.tolist()]
+                       for zoom, cells in df_cells.groupby('zoom')]
+
+def create_map(center, df_points=None, df_cells=None):
+    # Pontos já sem coordenadas inválidas/ausentes e com a cor do ícone (ver fome_zero/analytics.py)
+    m = folium.Map(location=center, zoom_start=2)
+
+    if df_cells is not None:
+        # Modo agregado: só as células pré-calculadas vão para o navegador
+        GridLayer(df_cells).add_to(m)
+        return m
+
+    # Todos os pontos seguem num único array; marcadores são criados no navegador
+    data = df_points.astype(object).values.tolist()
+    FastMarkerCluster(data, callback=MARKER_CALLBACK).add_to(m)
+
+    return m
+
+def map_html(ds, countries, show_grid):
+    """HTML completo do mapa para a seleção: restaurantes individuais ou, com `show_grid`, a grade."""
+    center = map_center(ds, countries)
+    if show_grid:
+        # Modo agregado: as células já vêm do cubo da grade, sem montar os pontos da seleção
+        df_cells = map_cells(ds, countries)
+        with timed('mapa folium', rows=len(df_cells)):
+            return folium.Figure().add_child(create_map(center, df_cells=df_cells)).render()
+    df_points = map_points(ds, countries)
+    with timed('mapa folium', rows=len(df_points)):
+        return folium.Figure().add_child(create_map(center, df_points)).render()
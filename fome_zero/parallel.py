@@ -0,0 +1,44 @@
+import contextvars
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+# ==============================================================================
+# Execução paralela dos gráficos de uma página
+# ==============================================================================
+
+# Threads compartilhadas por todas as sessões; FOME_ZERO_WORKERS=1 volta à execução sequencial
+MAX_WORKERS = int(os.environ.get('FOME_ZERO_WORKERS', min(8, os.cpu_count() or 1)))
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='fome-zero') if MAX_WORKERS > 1 else None
+
+def _in_page_context(func):
+    """Roda `func` numa thread do pool com o contexto do rerun (caches do Streamlit e medições de tempo)."""
+    ctx = get_script_run_ctx()
+    context = contextvars.copy_context()
+
+    def job():
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+        return context.run(func)
+    return job
+
+def submit_all(jobs):
+    """Dispara os cálculos independentes de `jobs` (nome -> função sem argumentos) de uma vez.
+
+    Devolve nome -> Future; a página desenha na ordem dela chamando `.result()` em cada um,
+    enquanto os seguintes continuam calculando. As funções não podem chamar `st.*` que
+    desenhem na página, só cálculos e `cached_chart`.
+    """
+    if _executor is None:
+        futures = {}
+        for name, func in jobs.items():
+            futures[name] = Future()
+            try:
+                futures[name].set_result(func())
+            except Exception as exc:
+                futures[name].set_exception(exc)
+        return futures
+    return {name: _executor.submit(_in_page_context(func)) for name, func in jobs.items()}
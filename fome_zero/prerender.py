@@ -0,0 +1,201 @@
+"""Pré-renderização em lote das páginas para seleções fixas, servida direto do disco.
+
+Para cada página e seleção, roda os mesmos cálculos e figuras das páginas
+(fome_zero/figures.py e fome_zero/maps.py) num pool de processos e grava o resultado
+em `data_set/zomato.v<N>.prerender/`: figuras Plotly e as tabelas e destaques que as acompanham
+em JSON, o mapa da página principal em HTML. Quando a seleção de quem acessa é uma das
+pré-renderizadas, `cached_chart` e o mapa leem o arquivo em vez de calcular.
+
+O nome de cada arquivo inclui a versão dos dados: depois de trocar o CSV (ou regerar o
+snapshot) os artefatos são ignorados até a próxima execução, que substitui todos:
+
+    python -m fome_zero.prerender                                     # filtros iniciais das páginas
+    python -m fome_zero.prerender --countries all --countries Brazil,Qatar
+    python -m fome_zero.prerender --pages principal paises --workers 2
+
+Sem `--countries`, a página principal usa todos os países e as demais os de
+`DEFAULT_COUNTRIES` (ver fome_zero/analytics.py).
+"""
+import argparse
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from fome_zero.analytics import DEFAULT_COUNTRIES, DEFAULT_CUISINES, Dataset
+from fome_zero.data import DATA_PATH, SNAPSHOT_VERSION, file_version
+from fome_zero.figures import page_charts
+from fome_zero.maps import map_html
+
+# ==============================================================================
+# Configurações
+# ==============================================================================
+
+PAGES = ('principal', 'paises', 'cidades', 'restaurantes', 'culinaria')
+
+# Valor de `--countries` que seleciona todos os países dos dados
+ALL_COUNTRIES = 'all'
+
+# Devolvido por `prerendered_chart` quando não há artefato (None é um resultado válido de gráfico)
+MISSING = object()
+
+def artifacts_dir(path=DATA_PATH):
+    return os.path.splitext(str(path))[0] + f'.v{SNAPSHOT_VERSION}.prerender'
+
+def artifact_path(kind, key, version, path=DATA_PATH):
+    """Arquivo do artefato `key` ('chart' ou 'map') gerado a partir da versão `version` dos dados."""
+    digest = hashlib.sha1(repr((kind, key, version)).encode()).hexdigest()
+    extension = 'html' if kind == 'map' else 'json'
+    return os.path.join(artifacts_dir(path), f'{kind}-{digest}.{extension}')
+
+# ==============================================================================
+# Formato dos artefatos
+# ==============================================================================
+
+def _encode(value):
+    """Resultado de um gráfico (figura, tabela, linha de tabela, número, None ou tupla deles) como JSON."""
+    import plotly.graph_objects as go
+
+    if value is None:
+        return None
+    if isinstance(value, go.Figure):
+        return {'figure': json.loads(value.to_json())}
+    if isinstance(value, pd.DataFrame):
+        return {'frame': json.loads(value.to_json(orient='table', index=False))}
+    if isinstance(value, pd.Series):
+        return {'series': json.loads(value.to_json(orient='split'))}
+    if isinstance(value, tuple):
+        return {'tuple': [_encode(item) for item in value]}
+    return {'number': float(value)}
+
+def _decode(data):
+    import plotly.io as pio
+
+    if data is None:
+        return None
+    if 'figure' in data:
+        return pio.from_json(json.dumps(data['figure']))
+    if 'frame' in data:
+        return pd.read_json(io.StringIO(json.dumps(data['frame'])), orient='table')
+    if 'series' in data:
+        # sem read_json: os valores de uma linha têm tipos diferentes e ficam como estão
+        series = data['series']
+        return pd.Series(series['data'], index=series['index'], name=series['name'], dtype=object)
+    if 'tuple' in data:
+        return tuple(_decode(item) for item in data['tuple'])
+    return data['number']
+
+def _write(target, text):
+    """Grava num temporário e troca de uma vez: quem lê nunca vê um arquivo pela metade."""
+    tmp = f'{target}.{os.getpid()}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp, target)
+
+# ==============================================================================
+# Leitura pelas páginas
+# ==============================================================================
+
+def prerendered_chart(chart_id, selection, version, path=DATA_PATH):
+    """Resultado pré-renderizado do gráfico para a seleção e a versão, ou `MISSING`."""
+    try:
+        with open(artifact_path('chart', (chart_id, selection), version, path), encoding='utf-8') as f:
+            return _decode(json.load(f))
+    except (OSError, ValueError):
+        return MISSING
+
+def prerendered_map(countries, show_grid, version, path=DATA_PATH):
+    """HTML pré-renderizado do mapa para os países (tupla ordenada) e a versão, ou None."""
+    try:
+        with open(artifact_path('map', (tuple(countries), bool(show_grid)), version, path), encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+# ==============================================================================
+# Geração em lote
+# ==============================================================================
+
+def render_selection(path, page, countries, cuisines=()):
+    """Grava os artefatos de uma página para uma seleção (`countries=None`: todos os países).
+
+    Roda num processo do pool; devolve quantos arquivos foram gravados.
+    """
+    from fome_zero.charts import selection_key
+
+    ds = Dataset.current(path)
+    countries = ds.countries() if countries is None else list(countries)
+
+    if page == 'principal':
+        key = tuple(sorted(countries))
+        for show_grid in (False, True):
+            _write(artifact_path('map', (key, show_grid), ds.version, path),
+                   map_html(ds.subset(countries), countries, show_grid))
+        return 2
+
+    # Mesma chave usada pelas páginas em `cached_chart`
+    selection = selection_key(countries, cuisines) if page == 'culinaria' else selection_key(countries)
+    charts = page_charts(page, ds.subset(countries), countries, list(cuisines))
+    for chart_id, build in charts.items():
+        _write(artifact_path('chart', (chart_id, selection), ds.version, path), json.dumps(_encode(build())))
+    return len(charts)
+
+def selections(pages=PAGES, countries=None, cuisines=DEFAULT_CUISINES):
+    """Tarefas (página, países, culinárias); sem `countries`, os filtros iniciais de cada página."""
+    tasks = []
+    for page in pages:
+        if countries:
+            page_countries = countries
+        else:
+            page_countries = [None] if page == 'principal' else [DEFAULT_COUNTRIES]
+        for selected in page_countries:
+            selected = None if selected is None else tuple(selected)
+            tasks.append((page, selected, tuple(cuisines) if page == 'culinaria' else ()))
+    return tasks
+
+def prerender(path=DATA_PATH, tasks=None, workers=None):
+    """Gera todos os artefatos de `tasks` do zero; devolve o diretório e o número de arquivos."""
+    tasks = selections() if tasks is None else tasks
+    version = file_version(path)
+    out = artifacts_dir(path)
+    shutil.rmtree(out, ignore_errors=True)  # artefatos de versões ou seleções anteriores
+    os.makedirs(out)
+
+    # spawn: cada processo carrega os dados por conta própria, sem herdar threads do pai
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [pool.submit(render_selection, str(path), page, countries, cuisines)
+                   for page, countries, cuisines in tasks]
+        written = sum(future.result() for future in futures)
+
+    if file_version(path) != version:
+        raise RuntimeError(f'{path} mudou durante a pré-renderização; rode novamente')
+    return out, written
+
+def _names(value):
+    return None if value == ALL_COUNTRIES else [name.strip() for name in value.split(',') if name.strip()]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', nargs='?', default=DATA_PATH, help='CSV de origem (padrão: data_set/zomato.csv)')
+    parser.add_argument('--pages', nargs='+', choices=PAGES, default=list(PAGES))
+    parser.add_argument('--countries', type=_names, action='append',
+                        help=f"países separados por vírgula, ou '{ALL_COUNTRIES}'; repita para mais seleções")
+    parser.add_argument('--cuisines', type=_names, default=DEFAULT_CUISINES,
+                        help='culinárias da página Culinária, separadas por vírgula')
+    parser.add_argument('--workers', type=int, help='processos em paralelo (padrão: um por CPU)')
+    args = parser.parse_args(argv)
+
+    # Execução em lote: versão lida direto do arquivo, sem a thread de recarga (ver fome_zero/registry.py)
+    os.environ['FOME_ZERO_RELOAD_INTERVAL'] = '0'
+
+    out, written = prerender(args.path, selections(args.pages, args.countries, args.cuisines or ()), args.workers)
+    print(f"{written} artefatos gravados em {out}")
+
+if __name__ == '__main__':
+    main()
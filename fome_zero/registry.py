@@ -0,0 +1,112 @@
+"""`Dataset` publicado, com recarga em segundo plano quando o `zomato.csv` é trocado.
+
+O registro guarda o próprio `Dataset` publicado: o DataFrame lido, as estruturas
+derivadas dele e a versão dos arquivos que foram de fato lidos. As chaves de cache
+usam `ds.version` do mesmo `Dataset` que calcula o valor guardado. Uma thread observa o CSV (e o
+snapshot); ao detectar uma versão nova, lê os dados e constrói todos os índices/cubos
+num `Dataset` novo e só então o publica, numa única atribuição. Até lá as sessões
+continuam usando o objeto anterior, sem esperar a reconstrução e sem ver estruturas
+pela metade; nada é reconstruído depois a partir do arquivo em disco.
+
+Intervalo de verificação (segundos) em `FOME_ZERO_RELOAD_INTERVAL`; `0` desliga a
+recarga em segundo plano e cada chamada confere a versão do arquivo, relendo os dados
+quando ela muda.
+"""
+import logging
+import os
+import threading
+import time
+
+from fome_zero.data import file_version
+
+logger = logging.getLogger(__name__)
+
+# ==============================================================================
+# Configurações
+# ==============================================================================
+
+DEFAULT_RELOAD_INTERVAL = 5.0
+
+def reload_interval():
+    return float(os.environ.get('FOME_ZERO_RELOAD_INTERVAL', DEFAULT_RELOAD_INTERVAL))
+
+def build_dataset(path):
+    """Lê `path` e constrói o DataFrame limpo e todas as estruturas derivadas dele."""
+    from fome_zero.analytics import Dataset
+
+    return Dataset.read(path).warm()
+
+# ==============================================================================
+# Registro
+# ==============================================================================
+
+class DatasetRegistry:
+    """`Dataset` publicado de um arquivo de dados e a thread que o mantém atualizado."""
+
+    def __init__(self, path, interval):
+        self.path = path
+        self.interval = interval
+        self.dataset = None
+        self._lock = threading.Lock()
+
+    def published(self):
+        if self.dataset is None:
+            with self._lock:
+                if self.dataset is None:
+                    from fome_zero.analytics import Dataset
+
+                    # primeira leitura: não há versão antiga para servir, as estruturas são
+                    # construídas sob demanda pelas páginas, como antes
+                    self.dataset = Dataset.read(self.path)
+                    threading.Thread(target=self._watch, name='fome-zero-reload', daemon=True).start()
+        return self.dataset
+
+    def _watch(self):
+        seen = self.dataset.version
+        while True:
+            time.sleep(self.interval)
+            try:
+                current = file_version(self.path)
+            except OSError:  # arquivo sendo substituído
+                continue
+            if current == self.dataset.version:
+                seen = current
+                continue
+            if current != seen:
+                # espera uma verificação sem mudanças: a cópia do arquivo pode não ter terminado
+                seen = current
+                continue
+            self.reload()
+
+    def reload(self):
+        """Constrói um `Dataset` completo a partir do arquivo e o publica; em caso de erro mantém o anterior."""
+        try:
+            dataset = build_dataset(self.path)
+        except Exception:
+            logger.exception('Falha ao recarregar %s; mantendo a versão publicada', self.path)
+            return
+        self.dataset = dataset  # troca atômica: leitores veem o objeto antigo ou o novo completo
+        logger.info('Dados recarregados de %s (versão %s)', self.path, dataset.version)
+
+_registries = {}
+_registries_lock = threading.Lock()
+
+# Com a recarga desligada: último `Dataset` lido de cada arquivo
+_unwatched = {}
+
+def published_dataset(path):
+    """`Dataset` publicado de `path` (com a recarga desligada, o da versão atual do arquivo)."""
+    path = str(path)
+    interval = reload_interval()
+    if interval <= 0:
+        dataset = _unwatched.get(path)
+        if dataset is None or dataset.version != file_version(path):
+            from fome_zero.analytics import Dataset
+
+            dataset = _unwatched[path] = Dataset.read(path)
+        return dataset
+    registry = _registries.get(path)
+    if registry is None:
+        with _registries_lock:
+            registry = _registries.setdefault(path, DatasetRegistry(path, interval))
+    return registry.published()
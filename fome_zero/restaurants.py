@@ -0,0 +1,80 @@
+from collections import namedtuple
+
+from fome_zero.cuisines import has_any_cuisine
+from fome_zero.timing import timed
+
+# ==============================================================================
+# Tabelas pré-agrupadas por restaurante
+# ==============================================================================
+
+NAME_KEYS = ['Restaurant Name', 'Country Name']
+
+# Maior `k` atendido pelos rankings: cada país guarda só os seus RANKING_MAX_K candidatos
+RANKING_MAX_K = 20
+
+# Ordem das maiores notas: há dezenas de empates em 4.9, desempatados por votos e depois
+# por ID, para o top-k não depender da ordem das linhas nem dos países selecionados
+RATED_ORDER = {'Aggregate rating': False, 'Votes': False, 'Restaurant ID': True}
+
+# Candidatos por país para cada ranking. Como cada linha pertence a um único país,
+# o top-k de uma seleção está sempre entre os top-k de cada país selecionado.
+RestaurantTables = namedtuple('RestaurantTables', ['voted', 'costly', 'rated', 'brazilian_best', 'brazilian_worst'])
+
+def _by_name(df, **aggregations):
+    table = df.groupby(NAME_KEYS, observed=True).agg(**aggregations).reset_index()
+    table['Country Name'] = table['Country Name'].astype(str)
+    return table
+
+def _sorted(table, order):
+    """`table` ordenada por `order` (coluna -> crescente?)."""
+    return table.sort_values(list(order), ascending=list(order.values()), kind='stable')
+
+def _country_candidates(table, order):
+    """As RANKING_MAX_K primeiras linhas de cada país na ordem `order` (empates na ordem original)."""
+    return _sorted(table, order).groupby('Country Name', sort=False).head(RANKING_MAX_K)
+
+@timed('build_restaurant_tables')
+def build_restaurant_tables(df, cuisine_index):
+    df_br = df[has_any_cuisine(df, cuisine_index, 'Brazilian', partial=True)]
+    by_name = _by_name(df, **{
+        'Votes': ('Votes', 'sum'),
+        'Average Cost for two': ('Average Cost for two', 'max'),
+    })
+    by_id = df[['Restaurant ID', 'Restaurant Name', 'Country Name', 'City', 'Cuisines', 'Aggregate rating', 'Votes']]
+    rating = {'Aggregate rating': ('Aggregate rating', 'mean')}
+    return RestaurantTables(
+        voted=_country_candidates(by_name[[*NAME_KEYS, 'Votes']], {'Votes': False}),
+        costly=_country_candidates(by_name[[*NAME_KEYS, 'Average Cost for two']], {'Average Cost for two': False}),
+        rated=_country_candidates(by_id.astype({'Country Name': str, 'City': str}), RATED_ORDER),
+        brazilian_best=_country_candidates(_by_name(df_br, **rating), {'Aggregate rating': False}),
+        brazilian_worst=_country_candidates(_by_name(df_br[df_br['Votes'] > 0], **rating), {'Aggregate rating': True}),
+    )
+
+# ==============================================================================
+# Rankings (nlargest/nsmallest sobre os candidatos dos países selecionados)
+# ==============================================================================
+
+def _select(table, countries, k):
+    if k > RANKING_MAX_K:
+        raise ValueError(f'k={k} maior que RANKING_MAX_K={RANKING_MAX_K}')
+    return table[table['Country Name'].isin(countries)]
+
+def top_voted(tables, countries, k=10):
+    return _select(tables.voted, countries, k).nlargest(k, 'Votes').reset_index(drop=True)
+
+def top_cost(tables, countries, k=10):
+    return _select(tables.costly, countries, k).nlargest(k, 'Average Cost for two').reset_index(drop=True)
+
+def top_rated(tables, countries, k=20):
+    """Maiores notas na ordem de RATED_ORDER (`Votes` só desempata e não volta no resultado)."""
+    return (_sorted(_select(tables.rated, countries, k), RATED_ORDER).head(k)
+                .drop(columns='Votes')
+                .reset_index(drop=True))
+
+def best_brazilian(tables, countries, k=10):
+    """Melhores notas de culinária brasileira dentro do Brasil (vazio se o Brasil não estiver selecionado)."""
+    countries = [country for country in countries if country == 'Brazil']
+    return _select(tables.brazilian_best, countries, k).nlargest(k, 'Aggregate rating').reset_index(drop=True)
+
+def worst_brazilian(tables, countries, k=10):
+    return _select(tables.brazilian_worst, countries, k).nsmallest(k, 'Aggregate rating').reset_index(drop=True)
@@ -0,0 +1,46 @@
+from collections import namedtuple
+
+# ==============================================================================
+# Esquema das colunas do zomato.csv
+# ==============================================================================
+
+# dtype: tipo usado na leitura do CSV (None = coluna criada em clean_code)
+# kind:  text | category | flag | number | coordinate (tipo final após clean_code)
+# download_only: a coluna não é usada pelas páginas, só aparece no arquivo exportado
+Column = namedtuple('Column', ['dtype', 'kind', 'download_only'])
+
+SCHEMA = {
+    'Restaurant ID':        Column('int64',   'number',     False),
+    'Restaurant Name':      Column('str',     'text',       False),
+    'Country Code':         Column('int16',   'number',     False),  # origem de Country Name
+    'City':                 Column('str',     'category',   False),
+    'Address':              Column('str',     'text',       True),
+    'Locality':             Column('str',     'text',       True),
+    'Locality Verbose':     Column('str',     'text',       True),
+    'Longitude':            Column('str',     'coordinate', False),
+    'Latitude':             Column('str',     'coordinate', False),
+    'Cuisines':             Column('str',     'text',       False),
+    'Average Cost for two': Column('int64',   'number',     False),
+    'Currency':             Column('str',     'category',   False),
+    'Has Table booking':    Column('int8',    'flag',       False),
+    'Has Online delivery':  Column('int8',    'flag',       False),
+    'Is delivering now':    Column('int8',    'flag',       False),
+    'Switch to order menu': Column('int8',    'flag',       True),
+    'Price range':          Column('int8',    'category',   False),
+    'Aggregate rating':     Column('float64', 'number',     False),
+    'Rating color':         Column('str',     'text',       False),
+    'Rating text':          Column('str',     'category',   True),
+    'Votes':                Column('int64',   'number',     False),
+    'Country Name':         Column(None,      'category',   False),
+}
+
+def csv_columns(download=False):
+    """Colunas do CSV usadas pelas páginas; com `download=True`, todas (arquivo exportado)."""
+    return [name for name, col in SCHEMA.items()
+            if col.dtype is not None and (download or not col.download_only)]
+
+def csv_dtypes(columns):
+    return {name: SCHEMA[name].dtype for name in columns}
+
+def columns_of_kind(kind):
+    return [name for name, col in SCHEMA.items() if col.kind == kind]
@@ -0,0 +1,152 @@
+"""Partições do dataset limpo por país (um arquivo Feather por `Country Code`).
+
+As páginas com filtro de países começam com poucos países selecionados: com as
+partições, `Dataset.subset` lê só os arquivos desses países, e o DataFrame inteiro só é
+montado quando alguma estrutura precisa de todos eles (página principal). Gere as
+partições junto com o snapshot (`python -m fome_zero.snapshot`) ou isoladamente:
+
+    python -m fome_zero.shards [caminho/do/zomato.csv]
+
+Cada execução grava uma geração nova em `data_set/zomato.v<N>.shards/<geração>/` e só
+então troca o `manifest.json`, que entra em `file_version`: um `Dataset` publicado
+continua lendo os arquivos da sua geração, que não mudam depois de gravados. A geração
+anterior é mantida para as sessões que ainda a usam; as mais antigas são apagadas.
+
+As partições são recortes do mesmo DataFrame de `load_frame`, com `FOME_ZERO_COMPACT`
+aplicado na gravação (mesmas colunas e tipos). Com o CSV mais novo que o manifesto ou
+com a compactação diferente na leitura, elas são ignoradas e o CSV/snapshot é lido inteiro.
+"""
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from fome_zero.compact import compact_frame, compaction_enabled
+from fome_zero.cuisines import build_cuisine_index
+from fome_zero.data import DATA_PATH, clean_code, manifest_path, read_csv, shards_dir
+from fome_zero.timing import timed
+
+# ==============================================================================
+# Configurações
+# ==============================================================================
+
+# Posição da linha no DataFrame inteiro: ao juntar partições, as linhas voltam à ordem
+# original e os desempates (ordenações estáveis, `nlargest`) continuam os mesmos
+ROW_COLUMN = '_row'
+
+# Gerações mantidas em disco: a atual e a anterior (ainda em uso até a recarga terminar)
+KEPT_GENERATIONS = 2
+
+def source_version(path=DATA_PATH):
+    """mtime/tamanho do CSV de origem, gravados no manifesto para conferir se as partições estão atualizadas."""
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+# ==============================================================================
+# Gravação
+# ==============================================================================
+
+def _write_json(target, data):
+    """Grava num temporário e troca de uma vez: quem lê nunca vê um manifesto pela metade."""
+    tmp = f'{target}.{os.getpid()}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp, target)
+
+def _prune_generations(root, keep=KEPT_GENERATIONS):
+    generations = sorted((entry for entry in os.scandir(root) if entry.is_dir()),
+                         key=lambda entry: entry.stat().st_mtime_ns, reverse=True)
+    for entry in generations[keep:]:
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+@timed('write_shards')
+def write_shards(path=DATA_PATH, df=None):
+    """Grava uma partição por país a partir do dataset já limpo (a deduplicação é global)."""
+    df = clean_code(read_csv(path)) if df is None else df
+    df = compact_frame(df) if compaction_enabled() else df
+
+    root = shards_dir(path)
+    generation = str(time.time_ns())  # nome novo a cada execução: arquivos já publicados não são regravados
+    os.makedirs(os.path.join(root, generation))
+
+    countries = {}
+    df_rows = df.assign(**{ROW_COLUMN: np.arange(len(df), dtype=np.int64)})
+    for name, df_country in df_rows.groupby('Country Name', observed=True, sort=True):
+        file = f"{generation}/{int(df_country['Country Code'].iloc[0])}.feather"
+        df_country.reset_index(drop=True).to_feather(os.path.join(root, file))
+        countries[str(name)] = file
+
+    _write_json(manifest_path(path), {
+        'source': source_version(path),
+        'compact': compaction_enabled(),
+        'countries': countries,
+        # opções do filtro de culinárias sem montar o índice de todos os países
+        'cuisines': build_cuisine_index(df).names.tolist(),
+    })
+    _prune_generations(root)
+    return root, len(countries)
+
+# ==============================================================================
+# Leitura sob demanda
+# ==============================================================================
+
+class Shards:
+    """Partições de uma geração: países disponíveis, culinárias de todos eles e leitura das linhas."""
+
+    def __init__(self, root, countries, cuisines, schema_file=None):
+        self.root = root
+        self.countries = countries  # nome do país -> arquivo, relativo a `root`
+        self.cuisines = cuisines
+        # partição lida quando a seleção é vazia, só para obter colunas e tipos
+        self.schema_file = schema_file or next(iter(countries.values()))
+
+    def restrict(self, countries):
+        """As partições dos países `countries` (nomes sem partição são ignorados)."""
+        selected = {name: self.countries[name] for name in sorted(set(countries)) if name in self.countries}
+        return Shards(self.root, selected, self.cuisines, self.schema_file)
+
+    def _read(self, file):
+        from pyarrow import feather
+
+        # memory_map evita copiar o arquivo inteiro para a memória na leitura
+        return feather.read_table(os.path.join(self.root, file), memory_map=True).to_pandas()
+
+    @timed('read_shards')
+    def frame(self):
+        """Linhas limpas de todos os países das partições, na ordem do DataFrame inteiro."""
+        if not self.countries:
+            return self._read(self.schema_file).iloc[:0].drop(columns=ROW_COLUMN)
+        parts = [self._read(file) for file in self.countries.values()]
+        df = parts[0] if len(parts) == 1 else pd.concat(parts, ignore_index=True)
+        return (df.sort_values(ROW_COLUMN, kind='stable')
+                  .drop(columns=ROW_COLUMN)
+                  .reset_index(drop=True))
+
+def read_shards(path=DATA_PATH):
+    """Partições utilizáveis de `path`, ou None (sem manifesto ou pyarrow, CSV mais novo, outra compactação)."""
+    if importlib.util.find_spec('pyarrow') is None:
+        return None
+    try:
+        with open(manifest_path(path), encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest['source'] != source_version(path) or manifest['compact'] != compaction_enabled():
+        return None
+    if not manifest['countries']:
+        return None
+    return Shards(shards_dir(path), manifest['countries'], manifest['cuisines'])
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    path = argv[0] if argv else DATA_PATH
+    out, n = write_shards(path)
+    print(f"{n} partições gravadas em {out}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,27 @@
+"""Gera o snapshot colunar (Feather/Arrow) do dataset já limpo e as partições por país.
+
+Rode novamente sempre que o `zomato.csv` for trocado; enquanto o snapshot
+estiver mais antigo que o CSV, `read_dataset` volta a ler o CSV (e as partições,
+ver fome_zero/shards.py, deixam de ser usadas):
+
+    python -m fome_zero.snapshot [caminho/do/zomato.csv]
+"""
+import sys
+
+from fome_zero.data import DATA_PATH, clean_code, read_csv, snapshot_path
+from fome_zero.shards import write_shards
+
+def write_snapshot(path=DATA_PATH):
+    df = clean_code(read_csv(path))
+    df.to_feather(snapshot_path(path))
+    write_shards(path, df)
+    return snapshot_path(path), len(df)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    path = argv[0] if argv else DATA_PATH
+    out, rows = write_snapshot(path)
+    print(f"Snapshot gravado em {out} ({rows} restaurantes)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""Tempo gasto em cada etapa de cálculo e renderização das páginas.
+
+Ative com a variável de ambiente `FOME_ZERO_PROFILE=1`: cada página passa a mostrar
+o expander "Desempenho" na barra lateral com as etapas do último rerun. Para exportar:
+
+    FOME_ZERO_TIMINGS_LOG=timings.jsonl   # uma linha JSON por etapa medida (acrescentada)
+    FOME_ZERO_METRICS_FILE=fome_zero.prom # totais do processo no formato texto do Prometheus
+
+Etapas aninhadas (ex.: `read_dataset` chama `clean_code`) aparecem cada uma com o seu tempo.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import ContextDecorator
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from functools import wraps
+
+import pandas as pd
+
+# ==============================================================================
+# Configurações
+# ==============================================================================
+
+LOG_ENV = 'FOME_ZERO_TIMINGS_LOG'
+METRICS_ENV = 'FOME_ZERO_METRICS_FILE'
+
+# Página usada quando a etapa roda fora de um rerun (benchmark, linha de comando)
+NO_PAGE = 'processo'
+
+def profiling_enabled():
+    return os.environ.get('FOME_ZERO_PROFILE', '').lower() in ('1', 'true', 'yes')
+
+# Etapas do rerun atual (cada execução de página roda na sua própria thread)
+_current = ContextVar('fome_zero_timings', default=None)
+
+# Totais do processo por (página, etapa): [execuções, segundos, linhas]
+_totals = {}
+_lock = threading.Lock()
+
+# ==============================================================================
+# Registro das etapas
+# ==============================================================================
+
+def start_page(page):
+    """Começa a registrar as etapas de um rerun da página `page`."""
+    if profiling_enabled():
+        _current.set((page, []))
+
+def record(step, seconds, rows=None):
+    if not profiling_enabled():
+        return
+    run = _current.get()
+    page, steps = run if run is not None else (NO_PAGE, None)
+    entry = {'page': page, 'step': step, 'seconds': seconds, 'rows': rows}
+    if steps is not None:
+        steps.append(entry)
+
+    with _lock:
+        total = _totals.setdefault((page, step), [0, 0.0, 0])
+        total[0] += 1
+        total[1] += seconds
+        total[2] += rows or 0
+
+    log_path = os.environ.get(LOG_ENV)
+    if log_path:
+        entry = {'time': datetime.now(timezone.utc).isoformat(timespec='milliseconds'), **entry}
+        with _lock, open(log_path, 'a', encoding='utf-8') as log:
+            log.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+def _row_count(result):
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return len(result)
+    return getattr(result, 'n_rows', None)
+
+class timed(ContextDecorator):
+    """Mede um bloco (`with timed('etapa') as t: ...; t.rows = n`) ou uma função (`@timed('etapa')`).
+
+    Como decorador, a quantidade de linhas vem do resultado quando ele é um DataFrame/Series.
+    """
+
+    def __init__(self, step, rows=None):
+        self.step = step
+        self.rows = rows
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.step, time.perf_counter() - self._start, self.rows)
+        return False
+
+    def __call__(self, func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(self.step) as step:
+                result = func(*args, **kwargs)
+                step.rows = _row_count(result)
+            return result
+        return wrapper
+
+# ==============================================================================
+# Resultados
+# ==============================================================================
+
+def finish_page():
+    """Etapas do rerun atual (DataFrame em ordem de término) e atualização do arquivo de métricas."""
+    run = _current.get()
+    steps = run[1] if run is not None else []
+    if os.environ.get(METRICS_ENV):
+        write_metrics(os.environ[METRICS_ENV])
+    return pd.DataFrame(steps, columns=['page', 'step', 'seconds', 'rows'])
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"')
+
+def metrics_text():
+    """Totais do processo no formato texto de exposição do Prometheus."""
+    with _lock:
+        totals = sorted(_totals.items())
+    lines = ['# HELP fome_zero_step_seconds Tempo gasto por etapa das páginas.',
+             '# TYPE fome_zero_step_seconds summary']
+    for (page, step), (count, seconds, _) in totals:
+        labels = f'page="{_label(page)}",step="{_label(step)}"'
+        lines.append(f'fome_zero_step_seconds_sum{{{labels}}} {seconds:.6f}')
+        lines.append(f'fome_zero_step_seconds_count{{{labels}}} {count}')
+    lines += ['# HELP fome_zero_step_rows_total Linhas produzidas por etapa.',
+              '# TYPE fome_zero_step_rows_total counter']
+    for (page, step), (_, _, rows) in totals:
+        lines.append(f'fome_zero_step_rows_total{{page="{_label(page)}",step="{_label(step)}"}} {rows}')
+    return '\n'.join(lines) + '\n'
+
+def write_metrics(path):
+    """Regrava o arquivo de métricas por inteiro (troca atômica, o coletor nunca lê pela metade)."""
+    tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as out:
+        out.write(metrics_text())
+    os.replace(tmp, path)
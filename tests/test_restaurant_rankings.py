@@ -0,0 +1,37 @@
+"""Rankings por candidatos de cada país contra a ordenação completa das linhas."""
+import random
+
+import pandas as pd
+import pytest
+
+from fome_zero.cuisines import build_cuisine_index
+from fome_zero.data import DATA_PATH, clean_code, read_csv
+from fome_zero.restaurants import RATED_ORDER, build_restaurant_tables, top_rated
+
+@pytest.fixture(scope='module')
+def df():
+    return clean_code(read_csv(DATA_PATH))
+
+@pytest.fixture(scope='module')
+def tables(df):
+    return build_restaurant_tables(df, build_cuisine_index(df))
+
+def full_sort(df, countries, k=20):
+    """Top-k das maiores notas ordenando todas as linhas da seleção, sem candidatos por país."""
+    df_sel = df[df['Country Name'].isin(countries)].astype({'Country Name': str, 'City': str})
+    return (df_sel.sort_values(list(RATED_ORDER), ascending=list(RATED_ORDER.values()))
+                  .head(k)[['Restaurant ID', 'Restaurant Name', 'Country Name', 'City', 'Cuisines', 'Aggregate rating']]
+                  .reset_index(drop=True))
+
+def test_all_countries(df, tables):
+    countries = sorted(map(str, df['Country Name'].unique()))
+    expected = full_sort(df, countries)
+    pd.testing.assert_frame_equal(top_rated(tables, countries), expected)
+    # os empates em 4.9 vêm de vários países, não só do primeiro da tabela de candidatos
+    assert expected['Country Name'].nunique() > 1
+
+@pytest.mark.parametrize('seed', range(10))
+def test_random_selection(df, tables, seed):
+    rng = random.Random(seed)
+    countries = rng.sample(sorted(map(str, df['Country Name'].unique())), rng.randint(1, 6))
+    pd.testing.assert_frame_equal(top_rated(tables, countries), full_sort(df, countries))
@@ -0,0 +1,72 @@
+"""`SelectionTotals` (atualização por diferença) contra o recálculo completo a partir das linhas."""
+import math
+import random
+
+import pytest
+
+from fome_zero.cubes import SelectionTotals, build_country_cube
+from fome_zero.cuisines import build_cuisine_index, explode_cuisines
+from fome_zero.data import DATA_PATH, clean_code, read_csv
+
+@pytest.fixture(scope='module')
+def df():
+    return clean_code(read_csv(DATA_PATH))
+
+@pytest.fixture(scope='module')
+def cuisine_index(df):
+    return build_cuisine_index(df)
+
+@pytest.fixture(scope='module')
+def cube(df, cuisine_index):
+    return build_country_cube(df, cuisine_index)
+
+def recompute(df, cuisine_index, countries):
+    """Métricas da seleção calculadas direto das linhas, sem cubo."""
+    df_sel = df[df['Country Name'].isin(countries)]
+    n = df_sel['Restaurant ID'].nunique()
+    return {
+        'Country Name': df_sel['Country Name'].nunique(),
+        'Restaurant ID': n,
+        'City': df_sel['City'].nunique(),
+        'Cuisines': explode_cuisines(df_sel, cuisine_index)['Cuisines'].nunique(),
+        'Is delivering now': int(df_sel['Is delivering now'].sum()),
+        'Has Table booking': int(df_sel['Has Table booking'].sum()),
+        'Price range 4': int((df_sel['Price range'] == 4).sum()),
+        'Votes': int(df_sel['Votes'].sum()),
+        'Aggregate rating': df_sel['Aggregate rating'].mean() if n else float('nan'),
+        'Average Cost for two': df_sel['Average Cost for two'].mean() if n else float('nan'),
+    }
+
+def assert_matches(stats, expected):
+    for col, value in expected.items():
+        if isinstance(value, float):
+            if math.isnan(value):
+                assert math.isnan(stats[col]), col
+            else:
+                assert stats[col] == pytest.approx(value), col
+        else:
+            assert stats[col] == value, col
+
+def test_empty_selection(df, cuisine_index, cube):
+    totals = SelectionTotals(cube)
+    assert_matches(totals.stats(), recompute(df, cuisine_index, []))
+
+    # Voltar ao vazio depois de incluir países zera contadores e somas
+    totals.update(cube['Country Name']).update([])
+    assert_matches(totals.stats(), recompute(df, cuisine_index, []))
+    assert not any(totals.counters.values())
+
+@pytest.mark.parametrize('seed', range(5))
+def test_random_add_remove(df, cuisine_index, cube, seed):
+    rng = random.Random(seed)
+    countries = sorted(cube['Country Name'])
+    totals = SelectionTotals(cube)
+    selected = set()
+    for _ in range(30):
+        # Inclui/remove alguns países por passo; de vez em quando esvazia a seleção
+        if rng.random() < 0.1:
+            selected = set()
+        else:
+            selected ^= set(rng.sample(countries, rng.randint(1, 3)))
+        totals.update(selected)
+        assert_matches(totals.stats(), recompute(df, cuisine_index, selected))
@@ -0,0 +1,81 @@
+"""Partições por país: `Dataset.subset` contra o `Dataset` do DataFrame inteiro."""
+import random
+import shutil
+
+import pandas as pd
+import pytest
+
+from fome_zero.analytics import (Dataset, city_rankings, country_stats, cuisine_stats, delivery_engagement,
+                                 map_points, restaurant_rankings)
+from fome_zero.data import DATA_PATH, file_version, load_frame
+from fome_zero.shards import write_shards
+
+@pytest.fixture(scope='module', params=['', '1'], ids=['plain', 'compact'])
+def sharded_path(request, tmp_path_factory):
+    """Cópia do CSV com partições gravadas, com e sem compactação."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('FOME_ZERO_COMPACT', request.param)
+        path = tmp_path_factory.mktemp('data') / 'zomato.csv'
+        shutil.copy(DATA_PATH, path)
+        write_shards(path)
+        yield path
+
+@pytest.fixture
+def datasets(sharded_path):
+    """(`Dataset` do DataFrame inteiro, `Dataset` novo lido das partições): cada teste começa sem o DataFrame inteiro."""
+    return Dataset(load_frame(sharded_path)), Dataset.read(sharded_path)
+
+def test_reads_shards(datasets):
+    full, sharded = datasets
+    assert sharded.shards is not None
+    assert sharded.countries() == full.countries()
+    assert sharded.shards.cuisines == full.cuisine_index.names.tolist()
+
+def test_same_rows_and_dtypes(datasets):
+    full, sharded = datasets
+    countries = ['Brazil', 'Qatar', 'India']
+    subset = sharded.subset(countries)
+    pd.testing.assert_frame_equal(subset.df, full.select(countries).reset_index(drop=True))
+    assert 'df' not in sharded.__dict__  # a seleção não lê as outras partições
+
+    pd.testing.assert_frame_equal(sharded.df, full.df)
+    assert sharded.subset(countries) is sharded  # com o DataFrame inteiro em memória, a seleção o reaproveita
+
+def test_empty_selection(datasets):
+    full, sharded = datasets
+    subset = sharded.subset([])
+    assert subset.df.empty
+    assert (subset.df.dtypes == full.df.dtypes).all()
+
+def assert_same(left, right):
+    if isinstance(left, pd.DataFrame):
+        pd.testing.assert_frame_equal(left.reset_index(drop=True), right.reset_index(drop=True))
+    elif isinstance(left, dict):
+        assert left.keys() == right.keys()
+        for key in left:
+            assert_same(left[key], right[key])
+    elif isinstance(left, tuple):
+        for a, b in zip(left, right, strict=True):
+            assert_same(a, b)
+    elif isinstance(left, pd.Series):
+        pd.testing.assert_series_equal(left, right, check_names=False)
+    else:
+        assert left == right or (pd.isna(left) and pd.isna(right))
+
+@pytest.mark.parametrize('seed', range(3))
+def test_page_results_match_full_dataset(datasets, seed):
+    full, sharded = datasets
+    rng = random.Random(seed)
+    countries = rng.sample(full.countries(), rng.randint(1, 5))
+    subset = sharded.subset(countries)
+    for compute in (country_stats, city_rankings, restaurant_rankings, delivery_engagement, map_points):
+        assert_same(compute(subset, countries), compute(full, countries))
+    cuisines = ['Italian', 'Japanese', 'Brazilian']
+    assert_same(cuisine_stats(subset, countries, cuisines), cuisine_stats(full, countries, cuisines))
+
+def test_manifest_changes_version(tmp_path):
+    path = tmp_path / 'zomato.csv'
+    shutil.copy(DATA_PATH, path)
+    before = file_version(path)
+    write_shards(path)
+    assert file_version(path) != before